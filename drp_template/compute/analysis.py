@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 import glob
 import os
 import matplotlib.pyplot as plt
@@ -146,7 +145,9 @@ def phase_fractions(data, labels=None, paramsfile='parameters.json', verbose=Fal
     # Define the headers for the table
     headers = ["Phase", "Count", "Fraction"]
 
-    # Create a DataFrame
+    # Create a DataFrame (pandas is only imported when a table is built)
+    import pandas as pd
+
     df = pd.DataFrame(table_values, columns=headers)
 
     # UPDATE
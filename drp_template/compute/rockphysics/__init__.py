@@ -34,7 +34,8 @@ from drp_template.compute.rockphysics.mixing import (
     density_fluid_mix,      # Fluid density mixing
     brie_fluid_mixing,      # Brie's empirical fluid law
     wood_fluid_mixing,      # Wood's equation for fluid suspensions
-    get_normalized_f_solid  # Normalize solid fractions
+    get_normalized_f_solid, # Normalize solid fractions
+    MixingContext           # Reusable buffers for repeated mixing calls
 )
 
 # Elastic bounds
@@ -102,6 +103,7 @@ from .mixing import (
     brie_fluid_mixing,
     wood_fluid_mixing,
     get_normalized_f_solid,
+    MixingContext,
 )
 
 from .bounds import (
@@ -134,6 +136,7 @@ __all__ = [
     'brie_fluid_mixing',
     'wood_fluid_mixing',
     'get_normalized_f_solid',
+    'MixingContext',
     # Elastic bounds
     'voigt_reuss_hill_bounds',
     'hashin_shtrikman_bounds',
@@ -12,6 +12,7 @@ Submodules
 density : Density mixing for solids and fluids
 fluid : Empirical fluid mixing laws (Brie, Wood, etc.)
 utils : Volume fraction normalization utilities
+context : Reusable buffers for repeated mixing calculations
 
 Functions
 ---------
@@ -26,6 +27,9 @@ From fluid module:
 From utils module:
     - get_normalized_f_solid : Normalize solid fractions based on porosity
 
+From context module:
+    - MixingContext : Preallocated workspace for repeated Wood/Brie calls
+
 Examples
 --------
 >>> from drp_template.compute.rockphysics.mixing import density_solid_mix
@@ -53,6 +57,7 @@ Martin Balcewicz (martin.balcewicz@rockphysics.org)
 from .density import density_solid_mix, density_fluid_mix
 from .fluid import brie_fluid_mixing, wood_fluid_mixing
 from .utils import get_normalized_f_solid
+from .context import MixingContext
 
 __all__ = [
     # Density mixing
@@ -63,4 +68,5 @@ __all__ = [
     'wood_fluid_mixing',
     # Utilities
     'get_normalized_f_solid',
+    'MixingContext',
 ]
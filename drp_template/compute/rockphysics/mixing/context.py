@@ -0,0 +1,151 @@
+"""
+Mixing Context
+==============
+
+Reusable scratch buffers for repeated fluid mixing calculations.
+
+Monte Carlo and parameter-sweep workflows evaluate the same mixing law many
+times with identically shaped inputs. ``MixingContext`` owns the temporary
+arrays needed by Wood's equation so that repeated calls do not allocate.
+
+Author
+------
+Martin Balcewicz (martin.balcewicz@rockphysics.org)
+"""
+
+import numpy as np
+
+from .fluid import brie_fluid_mixing
+
+__all__ = ['MixingContext']
+
+
+class MixingContext:
+    """
+    Preallocated workspace for repeated fluid mixing calculations.
+
+    Parameters
+    ----------
+    n_phases : int
+        Number of fluid phases of every mixture passed to the context.
+    dtype : numpy dtype, optional
+        Floating point type of the scratch buffers (default: np.float64).
+
+    Notes
+    -----
+    Unlike :func:`wood_fluid_mixing`, inputs are not checked for summing to 1;
+    the context is meant for hot loops over already validated inputs.
+
+    For batched inputs of shape (n_samples, n_phases) the returned arrays are
+    owned by the context and overwritten by the next batched call with the
+    same number of samples, unless ``out`` is given.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> ctx = MixingContext(n_phases=2)
+    >>> for sw in np.linspace(0.1, 0.9, 1000):
+    ...     res = ctx.wood([sw, 1 - sw], [2.2e9, 0.01e9], [1000, 1.2])
+
+    >>> # Batch of 1000 mixtures, moduli and densities shared by all samples
+    >>> sw = np.linspace(0.1, 0.9, 1000)
+    >>> fractions = np.column_stack([sw, 1 - sw])
+    >>> res = ctx.wood(fractions, [2.2e9, 0.01e9], [1000, 1.2])
+    >>> res['Vp'].shape
+    (1000,)
+    """
+
+    def __init__(self, n_phases, dtype=np.float64):
+        self.n_phases = int(n_phases)
+        self.dtype = np.dtype(dtype)
+        self._tmp = np.empty(self.n_phases, dtype=self.dtype)
+        self._batch = {}
+
+    def _batch_buffers(self, n_samples):
+        """Return the (work, K, rho, Vp) buffers for a batch of n_samples."""
+        buffers = self._batch.get(n_samples)
+        if buffers is None:
+            buffers = (
+                np.empty((n_samples, self.n_phases), dtype=self.dtype),
+                np.empty(n_samples, dtype=self.dtype),
+                np.empty(n_samples, dtype=self.dtype),
+                np.empty(n_samples, dtype=self.dtype),
+            )
+            self._batch[n_samples] = buffers
+        return buffers
+
+    def wood(self, fractions, bulk_moduli, densities, out=None):
+        """
+        Evaluate Wood's equation using the context's scratch buffers.
+
+        Parameters
+        ----------
+        fractions : array-like
+            Volume fractions, shape (n_phases,) or (n_samples, n_phases).
+        bulk_moduli : array-like
+            Bulk moduli of each phase (Pa), broadcastable to ``fractions``.
+        densities : array-like
+            Densities of each phase (kg/m³), broadcastable to ``fractions``.
+        out : tuple of ndarray, optional
+            For batched input, three arrays of shape (n_samples,) receiving
+            the Reuss bulk modulus, average density and P-wave velocity.
+
+        Returns
+        -------
+        dict
+            Same keys as :func:`wood_fluid_mixing`: 'bulk_modulus_reuss',
+            'rho_avg' and 'Vp'. Values are floats for a single mixture and
+            arrays of shape (n_samples,) for a batch.
+
+        Raises
+        ------
+        ValueError
+            If the last axis of ``fractions`` does not match ``n_phases``.
+        """
+        fractions = np.asarray(fractions, dtype=self.dtype)
+        if fractions.shape[-1] != self.n_phases:
+            raise ValueError(
+                f'Expected {self.n_phases} phases, got fractions with shape {fractions.shape}'
+            )
+
+        if fractions.ndim == 1:
+            bulk_modulus_reuss = 1.0 / np.divide(fractions, bulk_moduli, out=self._tmp).sum()
+            rho_avg = np.multiply(fractions, densities, out=self._tmp).sum()
+            return {
+                'bulk_modulus_reuss': float(bulk_modulus_reuss),
+                'rho_avg': float(rho_avg),
+                'Vp': float(np.sqrt(bulk_modulus_reuss / rho_avg))
+            }
+
+        work, bulk_modulus_reuss, rho_avg, Vp = self._batch_buffers(fractions.shape[0])
+        if out is not None:
+            bulk_modulus_reuss, rho_avg, Vp = out
+
+        np.divide(fractions, bulk_moduli, out=work)
+        work.sum(axis=1, out=bulk_modulus_reuss)
+        np.reciprocal(bulk_modulus_reuss, out=bulk_modulus_reuss)
+
+        np.multiply(fractions, densities, out=work)
+        work.sum(axis=1, out=rho_avg)
+
+        np.divide(bulk_modulus_reuss, rho_avg, out=Vp)
+        np.sqrt(Vp, out=Vp)
+
+        return {
+            'bulk_modulus_reuss': bulk_modulus_reuss,
+            'rho_avg': rho_avg,
+            'Vp': Vp
+        }
+
+    def brie(self, saturation_water, saturation_oil, saturation_gas,
+             bulk_modulus_water, bulk_modulus_oil, bulk_modulus_gas, exponent=3):
+        """
+        Evaluate Brie's equation; see :func:`brie_fluid_mixing`.
+
+        Brie's law is scalar and allocation free, so this simply forwards to
+        :func:`brie_fluid_mixing` to keep both mixing laws on one object.
+        """
+        return brie_fluid_mixing(
+            saturation_water, saturation_oil, saturation_gas,
+            bulk_modulus_water, bulk_modulus_oil, bulk_modulus_gas, exponent
+        )
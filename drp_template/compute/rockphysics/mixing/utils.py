@@ -10,7 +10,6 @@ Martin Balcewicz (martin.balcewicz@rockphysics.org)
 """
 
 import numpy as np
-import pandas as pd
 
 __all__ = ['get_normalized_f_solid']
 
@@ -91,6 +90,8 @@ def get_normalized_f_solid(porosity, f_solid_components, components=None):
     - Quartz: 48/(1-0.2) = 0.6
     - Calcite: 32/(1-0.2) = 0.4
     """
+    import pandas as pd
+
     porosity = np.asarray(porosity)
     f_solid_components = np.asarray(f_solid_components)
     
@@ -138,7 +139,7 @@ def get_normalized_f_solid(porosity, f_solid_components, components=None):
             )
         
         # Check if porosity length matches number of samples
-        if np.isscalar(porosity):
+        if porosity.ndim == 0:
             porosity = np.full(f_solid_components.shape[0], porosity)
         elif len(porosity) != f_solid_components.shape[0]:
             raise ValueError(
@@ -147,7 +148,8 @@ def get_normalized_f_solid(porosity, f_solid_components, components=None):
             )
         
         # Check if each row sums to 1 with porosity
-        row_sums = np.sum(f_solid_components, axis=1) + porosity
+        solid_sums = np.sum(f_solid_components, axis=1)
+        row_sums = solid_sums + porosity
         if not np.allclose(row_sums, 1.0):
             problematic = np.where(~np.isclose(row_sums, 1.0))[0]
             raise ValueError(
@@ -155,11 +157,12 @@ def get_normalized_f_solid(porosity, f_solid_components, components=None):
                 f'Problematic rows: {problematic.tolist()}'
             )
         
-        # Normalize each row
-        normalized_fractions = f_solid_components / (1 - porosity)[:, np.newaxis]
+        # Normalize each row in a single pass over the (n_samples, n_components) table
+        inv_solid = 1.0 / (1.0 - porosity)
+        normalized_fractions = np.multiply(f_solid_components, inv_solid[:, np.newaxis])
         
-        # Verify each row sums to 1
-        row_sums_norm = np.sum(normalized_fractions, axis=1)
+        # Verify each row sums to 1 (reuses the row sums instead of re-reducing the table)
+        row_sums_norm = solid_sums * inv_solid
         if not np.allclose(row_sums_norm, 1.0):
             raise ValueError(
                 f'Normalized fractions do not sum to 1 for all rows. '
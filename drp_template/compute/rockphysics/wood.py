@@ -29,14 +29,34 @@ Functions
 """
 
 import numpy as np
-import pandas as pd
-import math
+
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional dependency
+    njit = None
 
 __all__ = [
     'wood',
 ]
 
 
+if njit is not None:
+    # error_model='numpy': division by a zero modulus gives inf/0 like the
+    # NumPy batch path instead of raising ZeroDivisionError
+    @njit(cache=True, error_model='numpy')
+    def _wood_kernel(fraction, bulk_modulus, density):
+        """Single-mixture Wood's formula in one pass over the phases."""
+        compliance = 0.0
+        rho_average = 0.0
+        for i in range(fraction.shape[0]):
+            compliance += fraction[i] / bulk_modulus[i]
+            rho_average += fraction[i] * density[i]
+        Reuss_K = 1.0 / compliance
+        return rho_average, np.sqrt(Reuss_K / rho_average), Reuss_K
+else:
+    _wood_kernel = None
+
+
 def wood(porosity, phase, fraction, bulk_modulus_mineral, density):
     """
     Calculate P-wave velocity in fluid suspension using Wood's formula.
@@ -54,10 +74,13 @@ def wood(porosity, phase, fraction, bulk_modulus_mineral, density):
         Names of the phases (e.g., ['Quartz', 'Water'])
     fraction : array-like
         Volume fractions of each phase. Must sum to 1.
+        Shape (n_phases,) for a single mixture or (n_samples, n_phases)
+        to evaluate many mixtures at once.
     bulk_modulus_mineral : array-like
-        Bulk moduli of each phase (Pa)
+        Bulk moduli of each phase (Pa). Broadcast against ``fraction``, so
+        shape (n_phases,) can be shared by all samples.
     density : array-like
-        Densities of each phase (kg/m³)
+        Densities of each phase (kg/m³). Broadcast like ``bulk_modulus_mineral``.
     
     Returns:
     --------
@@ -66,9 +89,14 @@ def wood(porosity, phase, fraction, bulk_modulus_mineral, density):
         - rho_average: Average density of the mixture (kg/m³)
         - Wood_VP_wet: P-wave velocity (m/s)
         - Reuss_K: Reuss average bulk modulus (Pa)
+        Floats for a single mixture, arrays of shape (n_samples,) for a batch.
     
     Notes:
     ------
+    For a single mixture the three sums are evaluated by a compiled kernel
+    when the optional ``numba`` package is installed; batches always use
+    NumPy broadcasting.
+    
     Wood's formula:
     - K_Reuss = 1 / Σ(f_i / K_i)  (Reuss average for bulk modulus)
     - ρ_avg = Σ(f_i × ρ_i)        (Arithmetic average for density)
@@ -101,30 +129,36 @@ def wood(porosity, phase, fraction, bulk_modulus_mineral, density):
     density = [2650, 1000, 0.00119/1e-3]  # kg/m³
     
     rho_avg, vP, K_Reuss = wood(porosity, phase, fraction, bulk_modulus, density)
+    
+    # Example 3: Sweep of quartz-water mixtures over porosity
+    phase = ['Quartz', 'Water']
+    porosity = np.linspace(0.05, 0.4, 100)
+    fraction = np.column_stack([1 - porosity, porosity])  # (100, 2)
+    
+    rho_avg, vP, K_Reuss = wood(porosity, phase, fraction, [36e9, 2.2e9], [2650, 1000])
     ```
     """
-    properties = pd.DataFrame({
-        "Phase": phase,
-        "Fraction": fraction,
-        "Density": density,
-        "K": bulk_modulus_mineral
-    })
+    fraction = np.ascontiguousarray(fraction, dtype=np.float64)
+    bulk_modulus_mineral = np.ascontiguousarray(bulk_modulus_mineral, dtype=np.float64)
+    density = np.ascontiguousarray(density, dtype=np.float64)
 
-    # Reuss (isostress) average for bulk modulus
-    var = np.zeros((len(properties), 1))
-    for m in range(len(properties)):
-        var[m] = properties.loc[m, "Fraction"] / properties.loc[m, "K"]
+    # Single mixture: compiled fast path when numba is installed
+    if (_wood_kernel is not None and fraction.ndim == 1
+            and fraction.shape == bulk_modulus_mineral.shape == density.shape):
+        rho_average, Wood_VP_wet, Reuss_K = _wood_kernel(fraction, bulk_modulus_mineral, density)
+        return float(rho_average), float(Wood_VP_wet), float(Reuss_K)
 
-    Reuss_K = float(1 / sum(var))
+    # Reuss (isostress) average for bulk modulus (last axis = phases)
+    Reuss_K = 1.0 / (fraction / bulk_modulus_mineral).sum(axis=-1)
 
     # Arithmetic average for density
-    var = np.zeros((len(properties), 1))
-    for m in range(len(properties)):
-        var[m] = properties.loc[m, "Fraction"] * properties.loc[m, "Density"]
-
-    rho_average = float(sum(var))
+    rho_average = (fraction * density).sum(axis=-1)
 
     # P-wave velocity using Wood's formula
-    Wood_VP_wet = math.sqrt(Reuss_K / rho_average) / 1e-9
+    Wood_VP_wet = np.sqrt(Reuss_K / rho_average)
+
+    if np.ndim(Reuss_K) == 0:
+        # Single mixture: keep the scalar return contract
+        return float(rho_average), float(Wood_VP_wet), float(Reuss_K)
 
     return rho_average, Wood_VP_wet, Reuss_K
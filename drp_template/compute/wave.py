@@ -32,7 +32,22 @@ __all__ = [
     'velocity'
 ]
 
-def wavelength(velocity, frequency):
+
+def _min_value(value):
+    """Smallest element of a scalar or array-like, for input validation.
+
+    Python scalars are compared directly; arrays are reduced with ``min``
+    rather than building a boolean mask with ``np.any(value <= 0)``.
+    """
+    if isinstance(value, (int, float)):
+        return value
+    value = np.asarray(value)
+    if value.size == 0:
+        return np.inf
+    return value.min()
+
+
+def wavelength(velocity, frequency, verbose=False, out=None):
     """
     Calculate wavelength based on velocity and frequency.
     
@@ -47,6 +62,9 @@ def wavelength(velocity, frequency):
     Args:
         velocity (float or numpy.ndarray): Wave velocity in m/s.
         frequency (float or numpy.ndarray): Frequency in Hz.
+        verbose (bool, optional): Print a summary of the calculation. Defaults to False.
+        out (numpy.ndarray, optional): Preallocated array of the broadcast input
+            shape that receives the result, avoiding a temporary for large arrays.
         
     Returns:
         float or numpy.ndarray: Wavelength in meters.
@@ -72,29 +90,33 @@ def wavelength(velocity, frequency):
         # Result: [50.0, 25.0, 12.5] meters
         ```
     """
-    # Convert inputs to numpy arrays for consistent handling
-    velocity = np.asarray(velocity)
-    frequency = np.asarray(frequency)
-    
     # Validate inputs
-    if np.any(frequency <= 0):
+    if _min_value(frequency) <= 0:
         raise ValueError("Frequency must be positive and non-zero.")
     
-    if np.any(velocity < 0):
+    if _min_value(velocity) < 0:
         raise ValueError("Velocity must be non-negative.")
     
+    # Convert inputs to numpy arrays for consistent handling
+    velocity = np.asarray(velocity)
+    frequency = np.asarray(frequency)
+    
     # Calculate wavelength using the wave equation λ = v / f
-    wavelength = velocity / frequency
+    if out is not None:
+        wavelength = np.divide(velocity, frequency, out=out)
+    else:
+        wavelength = velocity / frequency
     
-    print_style(f'Wavelength calculation completed:\n'
-                f'Velocity: {velocity} m/s\n'
-                f'Frequency: {frequency} Hz\n'
-                f'Wavelength: {wavelength} m')
+    if verbose:
+        print_style(f'Wavelength calculation completed:\n'
+                    f'Velocity: {velocity} m/s\n'
+                    f'Frequency: {frequency} Hz\n'
+                    f'Wavelength: {wavelength} m')
     
     return wavelength
 
 
-def frequency(velocity, wavelength):
+def frequency(velocity, wavelength, verbose=False, out=None):
     """
     Calculate frequency based on velocity and wavelength.
     
@@ -109,6 +131,9 @@ def frequency(velocity, wavelength):
     Args:
         velocity (float or numpy.ndarray): Wave velocity in m/s.
         wavelength (float or numpy.ndarray): Wavelength in meters.
+        verbose (bool, optional): Print a summary of the calculation. Defaults to False.
+        out (numpy.ndarray, optional): Preallocated array of the broadcast input
+            shape that receives the result, avoiding a temporary for large arrays.
         
     Returns:
         float or numpy.ndarray: Frequency in Hz.
@@ -134,29 +159,33 @@ def frequency(velocity, wavelength):
         # Result: [50.0, 100.0, 200.0] Hz
         ```
     """
-    # Convert inputs to numpy arrays for consistent handling
-    velocity = np.asarray(velocity)
-    wavelength = np.asarray(wavelength)
-    
     # Validate inputs
-    if np.any(wavelength <= 0):
+    if _min_value(wavelength) <= 0:
         raise ValueError("Wavelength must be positive and non-zero.")
     
-    if np.any(velocity < 0):
+    if _min_value(velocity) < 0:
         raise ValueError("Velocity must be non-negative.")
     
+    # Convert inputs to numpy arrays for consistent handling
+    velocity = np.asarray(velocity)
+    wavelength = np.asarray(wavelength)
+    
     # Calculate frequency using the wave equation f = v / λ
-    frequency = velocity / wavelength
+    if out is not None:
+        frequency = np.divide(velocity, wavelength, out=out)
+    else:
+        frequency = velocity / wavelength
     
-    print_style(f'Frequency calculation completed:\n'
-                f'Velocity: {velocity} m/s\n'
-                f'Wavelength: {wavelength} m\n'
-                f'Frequency: {frequency} Hz')
+    if verbose:
+        print_style(f'Frequency calculation completed:\n'
+                    f'Velocity: {velocity} m/s\n'
+                    f'Wavelength: {wavelength} m\n'
+                    f'Frequency: {frequency} Hz')
     
     return frequency
 
 
-def velocity(frequency, wavelength):
+def velocity(frequency, wavelength, verbose=False, out=None):
     """
     Calculate velocity based on frequency and wavelength.
     
@@ -171,6 +200,9 @@ def velocity(frequency, wavelength):
     Args:
         frequency (float or numpy.ndarray): Frequency in Hz.
         wavelength (float or numpy.ndarray): Wavelength in meters.
+        verbose (bool, optional): Print a summary of the calculation. Defaults to False.
+        out (numpy.ndarray, optional): Preallocated array of the broadcast input
+            shape that receives the result, avoiding a temporary for large arrays.
         
     Returns:
         float or numpy.ndarray: Wave velocity in m/s.
@@ -196,23 +228,27 @@ def velocity(frequency, wavelength):
         # Result: [1250.0, 2500.0, 5000.0] m/s
         ```
     """
-    # Convert inputs to numpy arrays for consistent handling
-    frequency = np.asarray(frequency)
-    wavelength = np.asarray(wavelength)
-    
     # Validate inputs
-    if np.any(frequency <= 0):
+    if _min_value(frequency) <= 0:
         raise ValueError("Frequency must be positive and non-zero.")
     
-    if np.any(wavelength <= 0):
+    if _min_value(wavelength) <= 0:
         raise ValueError("Wavelength must be positive and non-zero.")
     
-    # Calculate velocity using the wave equation v = f × λ
-    velocity = frequency * wavelength
+    # Convert inputs to numpy arrays for consistent handling
+    frequency = np.asarray(frequency)
+    wavelength = np.asarray(wavelength)
     
-    print_style(f'Velocity calculation completed:\n'
-                f'Frequency: {frequency} Hz\n'
-                f'Wavelength: {wavelength} m\n'
-                f'Velocity: {velocity} m/s')
+    # Calculate velocity using the wave equation v = f × λ
+    if out is not None:
+        velocity = np.multiply(frequency, wavelength, out=out)
+    else:
+        velocity = frequency * wavelength
+    
+    if verbose:
+        print_style(f'Velocity calculation completed:\n'
+                    f'Frequency: {frequency} Hz\n'
+                    f'Wavelength: {wavelength} m\n'
+                    f'Velocity: {velocity} m/s')
     
     return velocity
@@ -5,11 +5,20 @@ This module handles reading, writing, and validating parameters.json files
 that store model metadata and configuration.
 """
 
+import copy
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from importlib.metadata import version as _pkg_version, PackageNotFoundError
 
+import numpy as np
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 __all__ = [
     'check_output_folder',
@@ -25,6 +34,9 @@ __all__ = [
 # Increment this string when you make a breaking change to the parameter file structure
 SCHEMA_VERSION = "1.0"
 
+# Directory containing this module and its packaged JSON files, resolved once
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 
 def _get_generator_string():
     """Return a generator provenance string like 'drp_template vX.Y.Z'."""
@@ -35,9 +47,51 @@ def _get_generator_string():
         return "drp_template"
 
 
+def _read_json_file(file_path):
+    """Parse a JSON file, using orjson when it is installed.
+
+    Files holding NaN or Infinity (written by the stdlib json module, but
+    rejected by orjson) are parsed again with json.loads.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _json_default(obj):
+    """Convert NumPy scalars and arrays (e.g. from phase_fractions) to JSON types."""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json_file(file_path, data):
+    """Write data as 4-space indented JSON, replacing the file atomically.
+
+    The data is serialized before the file is opened and written under a
+    temporary name, so a serialization error never truncates an existing file.
+    """
+    text = json.dumps(data, indent=4, default=_json_default)
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=1)
 def _load_parameters_schema():
-    """Load the embedded JSON Schema for parameters files."""
-    schema_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
+    """Load the embedded JSON Schema for parameters files (parsed once, do not mutate)."""
+    schema_dir = os.path.join(_MODULE_DIR, 'schemas')
     schema_path = os.path.join(schema_dir, 'parameters.schema.json')
     if not os.path.isfile(schema_path):
         # Schema is optional at runtime; return None if not packaged
@@ -46,41 +100,89 @@ def _load_parameters_schema():
         return json.load(f)
 
 
+@lru_cache(maxsize=1)
+def _get_parameters_validator():
+    """Build the Draft 7 validator for the parameters schema once, or None if absent."""
+    schema = _load_parameters_schema()
+    if schema is None:
+        return None
+    from jsonschema import Draft7Validator
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
+
 def _validate_parameters_dict(data):
     """Validate a dict against the parameters JSON Schema if available.
 
     Raises ValueError with a helpful message if validation fails.
     """
-    schema = _load_parameters_schema()
-    if schema is None:
-        return  # No-op if schema not present
     try:
-        from jsonschema import validate
-        validate(instance=data, schema=schema)
+        validator = _get_parameters_validator()
+        if validator is None:
+            return  # No-op if schema not present
+        validator.validate(data)
     except Exception as e:
         # Re-raise as ValueError with context for callers
         raise ValueError(f"parameters.json failed schema validation: {e}")
 
 
+# Parsed and validated parameter files keyed by path; each entry stores the
+# (mtime_ns, size) it was read at so rewritten files are parsed again
+_parameters_cache = {}
+
+
+def _load_parameters_file(file_path):
+    """Parse and validate a parameters file, reusing the result while it is unchanged.
+
+    Returns the cached dict itself; callers must copy before handing it out.
+    """
+    stat = os.stat(file_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _parameters_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = _read_json_file(file_path)
+
+    # Validate on read (best-effort; raise helpful error)
+    try:
+        _validate_parameters_dict(data)
+    except ValueError as ve:
+        raise ValueError(f"Invalid parameters file '{file_path}': {ve}")
+
+    _parameters_cache[file_path] = (signature, data)
+    return data
+
+
+# Resolved 'output' folder per working directory, filled by check_output_folder()
+_output_folder_cache = {}
+
+
 def check_output_folder():
     """
     Check if the 'output' folder exists in the current directory.
     If not, create the folder and save a README.md file.
 
+    The resolved path is cached per working directory; later calls from the
+    same directory only confirm it is still a directory (one stat call) and
+    recreate the folder if it was deleted or moved.
+
     Returns:
     str: Full path to the 'output' folder.
     """
-    output_folder = 'output'
+    cwd = os.getcwd()
+    cached = _output_folder_cache.get(cwd)
+    if cached is not None and os.path.isdir(cached):
+        return cached
+
+    output_folder = os.path.join(cwd, 'output')
 
     # Check if the 'output' folder exists, create if not
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
-        # Get the path to the directory containing the module
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-
         # Create README.md file with information from JSON file
-        readme_json_path = os.path.join(module_dir, 'readme_output.json')
+        readme_json_path = os.path.join(_MODULE_DIR, 'readme_output.json')
         with open(readme_json_path, 'r') as readme_json_file:
             readme_content = json.load(readme_json_file)
 
@@ -88,8 +190,9 @@ def check_output_folder():
         with open(readme_md_path, 'w') as readme_file:
             readme_file.write(readme_content['readme_content'])
 
-    # Return the full path to the 'output' folder
-    return os.path.abspath(output_folder)
+    # Cache and return the full path to the 'output' folder
+    _output_folder_cache[cwd] = output_folder
+    return output_folder
 
 
 def update_parameters_file(paramsfile='parameters.json', **kwargs):
@@ -132,8 +235,7 @@ def update_parameters_file(paramsfile='parameters.json', **kwargs):
     is_existing = os.path.isfile(file_path)
     if is_existing:
         # File exists, load existing data
-        with open(file_path, 'r') as file:
-            data = json.load(file)
+        data = _read_json_file(file_path)
     else:
         # File doesn't exist, create an empty dictionary
         data = {}
@@ -166,8 +268,8 @@ def update_parameters_file(paramsfile='parameters.json', **kwargs):
         raise
 
     # Write data back to the file
-    with open(file_path, 'w') as file:
-        json.dump(data, file, indent=4)
+    _write_json_file(file_path, data)
+    _parameters_cache.pop(file_path, None)
 
 
 def read_parameters_file(paramsfile='parameters.json', paramsvars=None):
@@ -217,6 +319,8 @@ def read_parameters_file(paramsfile='parameters.json', paramsvars=None):
     Notes
     -----
     - Automatically validates the file against the JSON Schema
+    - The parsed file is cached per path and re-read when its modification time
+      or size changes, so repeated reads (e.g. from plotting) skip JSON parsing
     - Raises clear errors if validation fails or parameters are missing
     - See drp_template/default_params/schemas/README.md for schema details
     """
@@ -228,34 +332,28 @@ def read_parameters_file(paramsfile='parameters.json', paramsvars=None):
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"The file '{file_path}' does not exist.")
 
-    # File exists, load existing data
-    with open(file_path, 'r') as file:
-        data = json.load(file)
-
-    # Validate on read (best-effort; raise helpful error)
-    try:
-        _validate_parameters_dict(data)
-    except ValueError as ve:
-        raise ValueError(f"Invalid parameters file '{file_path}': {ve}")
+    # File exists, load existing data (parsed and validated once per file version)
+    data = _load_parameters_file(file_path)
 
     # If specific parameter names are provided, get the values
+    # (copies, so callers cannot modify the cached data)
     if paramsvars:
         if isinstance(paramsvars, str):
             # If a single parameter name is provided, return its value
-            return data.get(paramsvars)
+            return copy.deepcopy(data.get(paramsvars))
         elif isinstance(paramsvars, list):
             # If a list of parameter names is provided, return a dictionary of values
-            read_parameters = {param: data.get(param) for param in paramsvars}
             missing_parameters = [param for param in paramsvars if param not in data]
-
             if missing_parameters:
                 raise ValueError(f"Parameters not found: {', '.join(missing_parameters)}")
-            else:
-                return list(read_parameters.values())[0] if len(read_parameters) == 1 else read_parameters
+
+            if len(paramsvars) == 1:
+                return copy.deepcopy(data[paramsvars[0]])
+            return copy.deepcopy({param: data[param] for param in paramsvars})
         else:
             raise ValueError("Invalid type for parameter_names. Use str, list, or None.")
     else:
-        return data
+        return copy.deepcopy(data)
 
 
 def validate_parameters_file(paramsfile='parameters.json'):
@@ -268,19 +366,20 @@ def validate_parameters_file(paramsfile='parameters.json'):
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"The file '{file_path}' does not exist.")
 
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    data = _read_json_file(file_path)
 
     _validate_parameters_dict(data)
     return True
 
 
+@lru_cache(maxsize=32)
 def read_package_config(config_filename):
     """
     Read a configuration file from the package directory (not from output folder).
     
     This is for reading package-internal configuration files like default_figure_settings.json,
-    not user data files.
+    not user data files. Each file is parsed once per process and the same dictionary
+    is returned on later calls, so treat the result as read-only (copy before modifying).
     
     Parameters:
     -----------
@@ -296,11 +395,8 @@ def read_package_config(config_filename):
     --------
     >>> settings = read_package_config('default_figure_settings.json')
     """
-    # Get the directory where this module is located
-    module_dir = os.path.dirname(os.path.abspath(__file__))
-    
     # Construct the full path to the config file
-    config_path = os.path.join(module_dir, config_filename)
+    config_path = os.path.join(_MODULE_DIR, config_filename)
     
     if not os.path.isfile(config_path):
         raise FileNotFoundError(f"Package configuration file '{config_path}' does not exist.")
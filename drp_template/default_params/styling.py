@@ -3,9 +3,12 @@ Styling utilities for console output and matplotlib figures.
 
 This module provides functions for formatted console printing and setting
 matplotlib figure defaults.
+
+matplotlib is imported inside the figure helpers so that importing this
+module (and drp_template.default_params) does not load pyplot.
 """
 
-import matplotlib.pyplot as plt
+import sys
 
 
 __all__ = [
@@ -15,54 +18,67 @@ __all__ = [
 ]
 
 
+# Separator character per print_style style; unknown styles fall back to '-'
+_STYLE_CHARS = {
+    'box': '#',
+    'section': '=',
+    'decorative': '*',
+    'indented_separator': '-',
+}
+
+
 def print_style(message, style='indented_separator'):
     """Print the given message with a specified style."""
-    if style == 'box':
-        style_chars = '#'
-    elif style == 'section':
-        style_chars = '='
-    elif style == 'decorative':
-        style_chars = '*'
-    elif style == 'indented_separator':
-        style_chars = '-'
-    else:
-        # Default to a simple line separator
-        style_chars = '-'
+    style_chars = _STYLE_CHARS.get(style, '-')
+
+    if '\n' not in message:
+        # Single line: no padding needed, emit everything in one write
+        separator = style_chars * len(message)
+        sys.stdout.write(f"{separator}\n{message}\n{separator}\n")
+        return
 
     lines = message.split('\n')  # Split the multiline message into lines
 
     max_line_length = max(len(line) for line in lines)
+    separator = style_chars * max_line_length
 
-    print(f"{style_chars * max_line_length}")
-    for line in lines:
-        # Pad shorter lines with spaces to match the maximum length
-        print(f"{line.ljust(max_line_length)}")
-    print(f"{style_chars * max_line_length}")
+    # Pad shorter lines with spaces to match the maximum length
+    body = '\n'.join(line.ljust(max_line_length) for line in lines)
+    sys.stdout.write(f"{separator}\n{body}\n{separator}\n")
 
 
 # Matplotlib figure defaults
 # Colormap after: Crameri, Fabio: Scientific colour maps, https://zenodo.org/record/1243862, (2021)
 
+_DEFAULT_FIGURE_RC = {
+    'figure.figsize': (10, 6),          # default figure size
+    'figure.facecolor': 'white',        # background color of the figure
+    'figure.subplot.left': 0.15,        # left
+    'figure.subplot.bottom': 0.11,      # bottom
+    'figure.subplot.right': 0.75,       # width
+    'figure.subplot.top': 0.8,          # height
+    'font.size': 20,                    # font size
+}
+
+_DEFAULT_DATA_FIGURE_RC = {
+    'figure.figsize': (12, 7),          # default figure size
+    'figure.facecolor': 'white',        # background color of the figure
+    'figure.subplot.left': 0.15,        # left
+    'figure.subplot.bottom': 0.11,      # bottom
+    'figure.subplot.right': 0.75,       # width
+    'font.size': 20,                    # font size
+}
+
+
 def default_figure():
     """
     Set default matplotlib figure parameters for standard plots.
     
     Sets figure size, background color, subplot positions, and font size.
     """
-    # set the default figure size
-    plt.rcParams['figure.figsize'] = (10, 6)
-
-    # set the background color of the figure
-    plt.rcParams['figure.facecolor'] = 'white'
-
-    # set the default x-axes position
-    plt.rcParams['figure.subplot.left'] = 0.15          # left
-    plt.rcParams['figure.subplot.bottom'] = 0.11        # bottom
-    plt.rcParams['figure.subplot.right'] = 0.75         # width
-    plt.rcParams['figure.subplot.top'] = 0.8            # height
+    import matplotlib.pyplot as plt
 
-    # set the font size
-    plt.rcParams['font.size'] = 20
+    plt.rcParams.update(_DEFAULT_FIGURE_RC)
 
 
 def default_data_figure():
@@ -72,16 +88,6 @@ def default_data_figure():
     Sets figure size, background color, subplot positions, and font size.
     Slightly larger than default_figure for data-heavy plots.
     """
-    # set the default figure size
-    plt.rcParams['figure.figsize'] = (12, 7)
-
-    # set the background color of the figure
-    plt.rcParams['figure.facecolor'] = 'white'
-
-    # set the default x-axes position
-    plt.rcParams['figure.subplot.left'] = 0.15          # left
-    plt.rcParams['figure.subplot.bottom'] = 0.11        # bottom
-    plt.rcParams['figure.subplot.right'] = 0.75         # width
+    import matplotlib.pyplot as plt
 
-    # set the font size
-    plt.rcParams['font.size'] = 20
+    plt.rcParams.update(_DEFAULT_DATA_FIGURE_RC)
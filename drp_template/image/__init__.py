@@ -1,5 +1,13 @@
+import os
+
+# Opt-in non-interactive backend for batch figure export: set DRP_AGG=1 before
+# importing drp_template.image to render with Agg (no GUI canvas per figure).
+if os.environ.get('DRP_AGG', '0') == '1':
+    import matplotlib
+    matplotlib.use('Agg')
+
 from .slicing import ortho_slice, ortho_views, add_slice_reference_lines
-from .plotting import histogram, plot_effective_modulus, save_figure, get_figure_colors, plot_velocity_vs_angle
+from .plotting import histogram, plot_effective_modulus, save_figure, save_figure_async, get_figure_colors, plot_velocity_vs_angle
 from .rendering import volume_rendering, get_lighting_preset
 from .animation import create_rotation_animation
 from .colormaps import get_phase_color_resources
\ No newline at end of file
@@ -5,28 +5,44 @@ This module loads and provides access to default figure settings from
 the default_figure_settings.json configuration file. It handles global
 matplotlib settings and makes them available to all image submodules.
 """
+from types import MappingProxyType
+
 import matplotlib.pyplot as plt
 from drp_template.default_params import read_package_config
 
 # Load the package configuration file
 _default_figure_settings = read_package_config('default_figure_settings.json')
 
-# Access global settings from the nested structure
-_global_settings = _default_figure_settings.get('global_settings', _default_figure_settings)
+# Access global settings from the nested structure (read-only views)
+_global_settings = MappingProxyType(
+    _default_figure_settings.get('global_settings', _default_figure_settings)
+)
+_layout_settings = MappingProxyType({
+    name: MappingProxyType(layout)
+    for name, layout in _default_figure_settings.get('ortho_views_layouts', {}).items()
+})
+_volume_rendering_settings = MappingProxyType(_default_figure_settings.get('volume_rendering', {}))
 
 # Apply global matplotlib settings
 plt.rcParams['font.size'] = _global_settings.get('font_size', 20)
 plt.rcParams['font.family'] = _global_settings.get('font_family', 'Tahoma')
 
 
-def get_global_settings():
+def get_global_settings(copy=False):
     """
     Get the global figure settings dictionary.
     
+    Parameters
+    ----------
+    copy : bool, optional
+        Return a mutable dict copy instead of the shared read-only view.
+        Default is False.
+    
     Returns
     -------
-    dict
-        Dictionary containing global settings like font_size, colormap, etc.
+    Mapping
+        Read-only mapping (or dict if ``copy=True``) containing global settings
+        like font_size, colormap, etc.
     
     Examples
     --------
@@ -34,7 +50,7 @@ def get_global_settings():
     >>> font_size = settings.get('font_size')
     >>> colormap = settings.get('colormap')
     """
-    return _global_settings.copy()
+    return dict(_global_settings) if copy else _global_settings
 
 
 def get_setting(key, default=None):
@@ -61,7 +77,7 @@ def get_setting(key, default=None):
     return _global_settings.get(key, default)
 
 
-def get_layout_config(layout_type='arbitrary'):
+def get_layout_config(layout_type='arbitrary', copy=False):
     """
     Get layout configuration for ortho_views.
     
@@ -69,11 +85,15 @@ def get_layout_config(layout_type='arbitrary'):
     ----------
     layout_type : str, optional
         Layout type ('rectangular' or 'arbitrary'). Default is 'arbitrary'.
+    copy : bool, optional
+        Return a mutable dict copy instead of the shared read-only view.
+        Default is False.
     
     Returns
     -------
-    dict
-        Layout configuration dictionary with positions, spacing, etc.
+    Mapping
+        Read-only layout configuration (or dict if ``copy=True``) with
+        positions, spacing, etc.
     
     Examples
     --------
@@ -81,24 +101,30 @@ def get_layout_config(layout_type='arbitrary'):
     >>> fig_width = layout.get('fig_width')
     >>> positions = layout.get('positions')
     """
-    layout_settings = _default_figure_settings.get('ortho_views_layouts', {})
-    layout_config = layout_settings.get(layout_type)
+    layout_config = _layout_settings.get(layout_type)
     
     # Fallback to arbitrary if specified layout doesn't exist
     if not layout_config:
-        layout_config = layout_settings.get('arbitrary', {})
+        layout_config = _layout_settings.get('arbitrary', MappingProxyType({}))
     
-    return layout_config.copy()
+    return dict(layout_config) if copy else layout_config
 
 
-def get_volume_rendering_config():
+def get_volume_rendering_config(copy=False):
     """
     Get volume rendering configuration settings.
     
+    Parameters
+    ----------
+    copy : bool, optional
+        Return a mutable dict copy instead of the shared read-only view.
+        Default is False.
+    
     Returns
     -------
-    dict
-        Volume rendering configuration with camera, lighting, window settings.
+    Mapping
+        Read-only volume rendering configuration (or dict if ``copy=True``)
+        with camera, lighting, window settings.
     
     Examples
     --------
@@ -106,19 +132,38 @@ def get_volume_rendering_config():
     >>> window_size = config.get('window_size')
     >>> camera_zoom = config.get('camera_zoom')
     """
-    return _default_figure_settings.get('volume_rendering', {}).copy()
-
-
-# For backward compatibility, expose commonly used settings as module-level variables
-im_left = get_setting('im_left', 0.25)
-im_left_xz = get_setting('im_left_xz', 0.2)
-im_right = get_setting('im_right', 1)
-im_bottom = get_setting('im_bottom', 0.1)
-im_width = get_setting('im_width', 0.6)
-im_height = get_setting('im_height', 0.8)
-cax_width = get_setting('cax_width', 0.04)
-fig_width = get_setting('fig_width', 10)
-fig_height = get_setting('fig_height', 10)
-cax_space_left = get_setting('cax_space_left', 0.2)
-cax_space_right = get_setting('cax_space_right', 0.02)
-im_title = get_setting('im_title', 'Title')
+    return dict(_volume_rendering_settings) if copy else _volume_rendering_settings
+
+
+# Defaults for the settings exposed as module-level variables
+_DEFAULTS = {
+    'im_left': 0.25,
+    'im_left_xz': 0.2,
+    'im_right': 1,
+    'im_bottom': 0.1,
+    'im_width': 0.6,
+    'im_height': 0.8,
+    'cax_width': 0.04,
+    'fig_width': 10,
+    'fig_height': 10,
+    'cax_space_left': 0.2,
+    'cax_space_right': 0.02,
+    'im_title': 'Title',
+}
+
+# For backward compatibility, expose commonly used settings as module-level variables,
+# resolved with one merge against the JSON values
+_resolved = {**_DEFAULTS, **_global_settings}
+im_left = _resolved['im_left']
+im_left_xz = _resolved['im_left_xz']
+im_right = _resolved['im_right']
+im_bottom = _resolved['im_bottom']
+im_width = _resolved['im_width']
+im_height = _resolved['im_height']
+cax_width = _resolved['cax_width']
+fig_width = _resolved['fig_width']
+fig_height = _resolved['fig_height']
+cax_space_left = _resolved['cax_space_left']
+cax_space_right = _resolved['cax_space_right']
+im_title = _resolved['im_title']
+del _resolved
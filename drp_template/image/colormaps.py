@@ -46,19 +46,41 @@ __all__ = [
     'get_phase_color_resources'
 ]
 
+def _fast_unique(a: np.ndarray) -> np.ndarray:
+    """Sorted unique values of an array, like ``np.unique(a)``.
+
+    Non-negative integer arrays with values below 2**16 (e.g. segmented uint8/uint16
+    volumes) are counted with a linear ``np.bincount`` pass instead of a full sort.
+    """
+    if a.size and np.issubdtype(a.dtype, np.integer):
+        if a.dtype in (np.uint8, np.uint16):
+            in_range = True
+        else:
+            in_range = a.min() >= 0 and a.max() < (1 << 16)
+        if in_range:
+            return np.flatnonzero(np.bincount(a.ravel())).astype(a.dtype)
+    return np.unique(a)
+
 def analyze_phase_data(data: np.ndarray) -> dict:
     """Analyze data to determine if discrete integer phases are present.
 
     Returns dict with keys: is_integer, unique_ids (np.ndarray), n_phases.
+    Pass the result to get_phase_color_resources(..., analysis=...) to avoid
+    analyzing the same volume twice.
     """
     if not isinstance(data, np.ndarray):
         data = np.asarray(data)
-    # Integer check: all values equal to their rounded representation
-    try:
-        is_integer = np.all(np.equal(data, np.round(data)))
-    except Exception:
-        is_integer = False
-    unique_ids = np.unique(data.astype(int)) if is_integer else np.array([])
+    if np.issubdtype(data.dtype, np.integer):
+        # Integer dtypes are integer-valued by definition; skip the rounded copy
+        is_integer = True
+        unique_ids = _fast_unique(data).astype(int)
+    else:
+        # Integer check: all values equal to their rounded representation
+        try:
+            is_integer = np.all(np.equal(data, np.round(data)))
+        except Exception:
+            is_integer = False
+        unique_ids = np.unique(data.astype(int)) if is_integer else np.array([])
     return {
         'is_integer': bool(is_integer),
         'unique_ids': unique_ids,
@@ -70,7 +92,7 @@ def _resolve_base_colormap(name: str):
     Accepts names like 'batlow' or 'cm.batlow'. Falls back to viridis.
     """
     if name is None:
-        return plt.cm.get_cmap('viridis')
+        return plt.colormaps['viridis']
     name = str(name)
     try:
         if name.startswith('cm.'):
@@ -79,9 +101,9 @@ def _resolve_base_colormap(name: str):
             raw = name
         if cmc is not None and hasattr(cmc, raw):
             return getattr(cmc, raw)
-        return plt.cm.get_cmap(raw)
+        return plt.colormaps[raw]
     except Exception:
-        return plt.cm.get_cmap('viridis')
+        return plt.colormaps['viridis']
 
 def build_phase_colormap(unique_ids: np.ndarray, cmap_name: str = 'batlow', brightness: float = 1.0):
     """Build discrete ListedColormap, BoundaryNorm, and mapping dict for given unique phase IDs.
@@ -129,14 +151,17 @@ def build_phase_colormap(unique_ids: np.ndarray, cmap_name: str = 'batlow', brig
     norm = BoundaryNorm(boundaries, ncolors=n, clip=True)
     return listed, norm, mapping, boundaries
 
-def get_phase_color_resources(data: np.ndarray, cmap_name: str = 'batlow', brightness: float = 1.0) -> dict:
+def get_phase_color_resources(data: np.ndarray, cmap_name: str = 'batlow', brightness: float = 1.0,
+                              analysis: dict | None = None) -> dict:
     """Return unified color resources for a labeled volume.
 
     For integer-labeled data with <=256 unique phases returns discrete resources.
     Otherwise returns continuous base colormap and norm=None while still supplying
-    a mapping for discovered integer IDs (or empty mapping).
+    a mapping for discovered integer IDs (or empty mapping). A precomputed
+    ``analyze_phase_data(data)`` result may be passed as ``analysis``.
     """
-    analysis = analyze_phase_data(data)
+    if analysis is None:
+        analysis = analyze_phase_data(data)
     is_integer = analysis['is_integer']
     unique_ids = analysis['unique_ids']
 
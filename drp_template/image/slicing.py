@@ -1,15 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
-try:
-    # Prefer cmcrameri perceptually uniform colormaps when available
-    from cmcrameri import cm as cmc
-except Exception:
-    cmc = None
 from matplotlib.colors import ListedColormap, BoundaryNorm
 from matplotlib.ticker import FixedLocator, FixedFormatter
 from drp_template.default_params import read_parameters_file
+from drp_template.tools import find_slice_with_all_values
 from drp_template.image import _config
-from drp_template.image.colormaps import get_phase_color_resources
+from drp_template.image.colormaps import (
+    analyze_phase_data,
+    get_phase_color_resources,
+    _fast_unique,
+    _resolve_base_colormap,
+)
 
 
 __all__ = [
@@ -32,7 +33,146 @@ cax_space_left = _config.cax_space_left
 cax_space_right = _config.cax_space_right
 im_title = _config.im_title
 
-def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, plane='xy', subvolume=None, labels=None, title=None, voxel_size=None, dark_mode=True, cmap_intensity=1.0, ax=None, show_colorbar=True, norm=None):
+# Defaults from the global settings, resolved once at import
+_DEFAULT_CMAP_INTENSITY = global_settings.get('cmap_intensity', 1.0)
+_DEFAULT_CMAP = _resolve_base_colormap(global_settings.get('colormap'))
+
+
+# Intensity-adjusted colormaps keyed by (id(base_cmap), intensity). The base
+# colormap is kept in the value so its id cannot be reused while cached.
+_ADJUSTED_CMAP_CACHE_SIZE = 8
+_adjusted_cmap_cache = {}
+
+
+def _adjust_cmap_intensity(base_cmap, intensity):
+    """
+    Return a ListedColormap with the RGB values of ``base_cmap`` scaled by ``intensity``.
+
+    Values > 1.0 increase brightness, < 1.0 decrease it; results are clamped to [0, 1].
+    Repeated calls with the same colormap and intensity (e.g. the three views of
+    ortho_views) return the same cached colormap.
+    """
+    if isinstance(base_cmap, str):
+        base_cmap = plt.colormaps[base_cmap]
+
+    key = (id(base_cmap), intensity)
+    entry = _adjusted_cmap_cache.get(key)
+    if entry is None or entry[0] is not base_cmap:
+        if len(_adjusted_cmap_cache) >= _ADJUSTED_CMAP_CACHE_SIZE:
+            _adjusted_cmap_cache.pop(next(iter(_adjusted_cmap_cache)))
+        colors = base_cmap(np.linspace(0, 1, 256))
+        # Adjust the RGB values (not alpha)
+        colors[:, :3] = np.clip(colors[:, :3] * intensity, 0, 1)
+        entry = _adjusted_cmap_cache[key] = (base_cmap, ListedColormap(colors))
+    return entry[1]
+
+
+# Per-plane layout of ortho_slice: sliced volume axis, parameter holding the
+# slice count, axis labels, y-tick side, right-to-left x axis, and colorbar side/offset
+_PLANE_SPEC = {
+    'xy': dict(axis=2, size_key='nz', xlabel='X-axis', ylabel='Y-axis',
+               ytick_side='right', invert_x=True, im_left=im_left, cbar_side='left'),
+    'yz': dict(axis=0, size_key='nx', xlabel='Y-axis', ylabel='Z-axis',
+               ytick_side='right', invert_x=True, im_left=im_left, cbar_side='left'),
+    'xz': dict(axis=1, size_key='ny', xlabel='X-axis', ylabel='Z-axis',
+               ytick_side='left', invert_x=False, im_left=im_left_xz, cbar_side='right'),
+}
+
+
+def _downsample_for_display(data2d, max_pixels, block_mean=False):
+    """
+    Reduce a 2D slice to at most ``max_pixels`` along each axis for drawing.
+
+    Uses every n-th pixel (labeled data) or the mean of n x n blocks (continuous
+    data, ragged edge blocks included). The result is always C-contiguous.
+    """
+    factor = -(-max(data2d.shape) // int(max_pixels)) if max_pixels else 1
+    if factor <= 1:
+        # Row-major copy of (transposed) slice views, made once here rather than
+        # by Matplotlib's strided walk while colormapping and resampling
+        return np.ascontiguousarray(data2d)
+    if not block_mean:
+        return np.ascontiguousarray(data2d[::factor, ::factor])
+
+    sums = data2d.astype(np.float64)
+    counts = 1
+    for axis, n in enumerate(data2d.shape):
+        starts = np.arange(0, n, factor)
+        sums = np.add.reduceat(sums, starts, axis=axis)
+        sizes = np.diff(np.append(starts, n))
+        counts = counts * (sizes[:, np.newaxis] if axis == 0 else sizes[np.newaxis, :])
+    return sums / counts
+
+
+def _label_key(key):
+    """Phase value of a labels key: integer-like keys ('2', 2) become int, others are kept."""
+    if isinstance(key, str):
+        stripped = key.strip()
+        return int(stripped) if stripped.lstrip('-').isdigit() else key
+    if isinstance(key, (int, np.integer)):
+        return int(key)
+    return key
+
+
+def _set_colorbar_labels(cbar, labels):
+    """
+    Put phase labels on a colorbar.
+
+    ``labels`` is a dict mapping phase values (int or numeric str keys) to names,
+    placed at the sorted values, or a list of names placed at 0, 1, 2, ...
+    """
+    if isinstance(labels, dict):
+        items = sorted((_label_key(k), v) for k, v in labels.items())
+        tick_positions, tick_labels = zip(*items) if items else ((), ())
+        cbar.set_ticks(list(tick_positions))
+        cbar.ax.set_yticklabels(list(tick_labels))
+    else:
+        cbar.set_ticks(np.arange(len(labels)))
+        cbar.ax.set_yticklabels(labels)
+
+
+def _plane_index(axis, index):
+    """Index tuple selecting position ``index`` along ``axis`` of a 3D array (a view)."""
+    return (slice(None),) * axis + (index,)
+
+
+def _style_plane_axes(ax, spec, label_kw, text_color):
+    """Set axis labels and y-tick side of an ortho_slice plane (x direction comes from the image extent)."""
+    side = spec['ytick_side']
+    ax.set_xlabel(spec['xlabel'], **label_kw)
+    ax.set_ylabel(spec['ylabel'], **label_kw)
+
+    if side == 'right':
+        ax.yaxis.tick_right()
+    else:
+        ax.yaxis.tick_left()
+    ax.yaxis.set_label_position(side)
+    ax.spines[side].set_visible(True)
+
+    ax.tick_params(axis='both', colors=text_color)
+
+
+def _place_colorbar(fig, ax, pcm, spec):
+    """Add a vertical colorbar beside the (already positioned) slice axes."""
+    position = ax.get_position()
+
+    # Colorbar spans the subplot height, offset left of x0 or right of x1
+    side = spec['cbar_side']
+    if side == 'left':
+        cax_left = position.x0 - (position.x0 * cax_space_left)
+    else:
+        cax_left = position.x1 + (position.x1 * cax_space_right)
+
+    cax = fig.add_axes([cax_left, position.y0, cax_width, position.height])  # left, bottom, width, height
+    cbar = fig.colorbar(pcm, cax=cax, orientation='vertical')
+
+    # Move the colorbar ticks and label to the outer side
+    cbar.ax.yaxis.set_ticks_position(side)
+    cbar.ax.yaxis.set_label_position(side)
+    return cbar
+
+
+def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, plane='xy', subvolume=None, labels=None, title=None, voxel_size=None, dark_mode=True, cmap_intensity=1.0, ax=None, show_colorbar=True, norm=None, unique_values=None, max_display_pixels=None):
     """
     Visualize 2D slice of 3D volumetric data using Matplotlib.
 
@@ -60,6 +200,15 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
         If True, set a dark background; otherwise, set a light background (default: True).
     show_colorbar : bool, optional
         If True, display the colorbar; otherwise, suppress it (default: True).
+    unique_values : array-like, optional
+        Precomputed ``np.unique(data)``. Only used when ``slice`` is None to check that the
+        default slice contains all phases; pass it to avoid sorting the whole volume again.
+    max_display_pixels : int or None, optional
+        Largest number of image pixels drawn along either slice axis (default: None, full
+        resolution). Larger slices are downsampled for display only (nearest for labeled
+        data, block mean for continuous data); axes keep voxel coordinates. Set it (e.g. to
+        the figure width in pixels) to speed up interactive views of large slices; keep the
+        default for figures that are saved at high dpi.
 
     Returns
     -------
@@ -67,8 +216,8 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
         The Matplotlib figure object.
     ax : Matplotlib Axes
         The Matplotlib axes object.
-    pcm : Matplotlib QuadMesh
-        The QuadMesh object for the plot.
+    pcm : Matplotlib AxesImage
+        The image object for the plot (a valid mappable for ``fig.colorbar``).
 
     Example:
         import numpy as np
@@ -79,11 +228,11 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
 
     Notes:
         The function reads default plotting parameters from a JSON file. Make sure to provide a valid path to the JSON file or use the default if not specified. The colormap cmap_set can be either a Matplotlib colormap or a string specifying the colormap name. The subvolume parameter draws a rectangle around a specified subvolume if provided. The labels parameter can be used to customize colorbar ticks.
+        For scripted/batch export, set the environment variable DRP_AGG=1 before importing drp_template.image to use the non-interactive Agg backend.
     """
     
     # Get the default colormap intensity if not in function parameters
-    default_cmap_intensity = global_settings.get('cmap_intensity', 1.0)
-    cmap_intensity = cmap_intensity or default_cmap_intensity
+    cmap_intensity = cmap_intensity or _DEFAULT_CMAP_INTENSITY
     
     # Get basic info about data
     dimensions = data.shape
@@ -99,51 +248,24 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
         face_color = 'white'
         edge_color = 'black'
 
+    # Shared text properties for axis labels and title; rcParams are read once per
+    # call (not at import) so later changes, e.g. by default_figure(), still apply
+    label_kw = dict(color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
+
     if cmap_set is None:
-        # Get the default colormap (e.g., 'batlow', 'viridis', or 'cm.batlow')
-        cmap_set = global_settings.get('colormap')
-        # Resolve string safely without eval
-        if isinstance(cmap_set, str):
-            name = cmap_set
-            try:
-                if name.startswith('cm.'):
-                    # Explicit cmcrameri prefix, e.g., 'cm.batlow'
-                    cmap_name = name.split('.', 1)[1]
-                    if cmc is not None and hasattr(cmc, cmap_name):
-                        cmap_set = getattr(cmc, cmap_name)
-                    else:
-                        # Try matplotlib as fallback
-                        cmap_set = plt.cm.get_cmap(cmap_name)
-                else:
-                    # Plain name; try cmcrameri first, then matplotlib
-                    if cmc is not None and hasattr(cmc, name):
-                        cmap_set = getattr(cmc, name)
-                    else:
-                        cmap_set = plt.cm.get_cmap(name)
-            except Exception:
-                # Fallback to a safe default
-                cmap_set = plt.cm.get_cmap('viridis')
-        
+        # Default colormap from the global settings, resolved once at import
+        cmap_set = _DEFAULT_CMAP
+    elif isinstance(cmap_set, str):
+        # Names like 'batlow', 'cm.batlow' or 'viridis' (cmcrameri first, then matplotlib)
+        cmap_set = _resolve_base_colormap(cmap_set)
 
-    # Adjust colormap intensity if needed
+    # Adjust colormap intensity if needed (cached per colormap and intensity)
     if cmap_intensity != 1.0:
-        if isinstance(cmap_set, str):
-            base_cmap = plt.cm.get_cmap(cmap_set)
-        else:
-            base_cmap = cmap_set
-            
-        # Create a modified colormap with adjusted intensity
-        colors = base_cmap(np.linspace(0, 1, 256))
-        
-        # Adjust the RGB values (not alpha)
-        # Values > 1.0 increase brightness, < 1.0 decrease brightness
-        # Clamp values to valid range [0, 1]
-        colors[:, :3] = np.clip(colors[:, :3] * cmap_intensity, 0, 1)
-        
-        # Create new colormap
-        cmap_set = ListedColormap(colors)
+        cmap_set = _adjust_cmap_intensity(cmap_set, cmap_intensity)
 
     # Create a figure and axis with adjusted font family and size
+    # Axes supplied by the caller without a colorbar (e.g. ortho_views) are laid out by the caller
+    caller_layout = ax is not None and not show_colorbar
     if ax is None:
         fig, ax = plt.subplots(figsize=(fig_width, fig_height), facecolor=face_color, edgecolor=edge_color)
         fig.set_facecolor(face_color)
@@ -152,63 +274,51 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
 
     # Helper function to check if a slice contains all unique values from the full data
     def slice_has_all_phases(data_slice, full_data_unique):
-        slice_unique = np.unique(data_slice)
-        return np.all(np.isin(full_data_unique, slice_unique))
-
-    if plane == 'xy':
-        if slice is None:
-            nz = read_parameters_file(paramsfile=paramsfile, paramsvars='nz')
-            slice = (nz // 2) - 1
-            
-            # Check if center slice has all phases
-            unique_values = np.unique(data)
-            if not slice_has_all_phases(data[:, :, slice], unique_values):
-                # Import the function from tools
-                from drp_template.tools import find_slice_with_all_values
-                slice_dict = find_slice_with_all_values(data)
-                if slice_dict['xy'] is not None:
-                    slice = slice_dict['xy']
-
-        data = data[:, :, slice]
-    elif plane == 'yz':
-        if slice is None:
-            nx = read_parameters_file(paramsfile=paramsfile, paramsvars='nx')
-            slice = (nx // 2) - 1
-            
-            # Check if center slice has all phases
-            unique_values = np.unique(data)
-            if not slice_has_all_phases(data[slice, :, :], unique_values):
-                # Import the function from tools
-                from drp_template.tools import find_slice_with_all_values
-                slice_dict = find_slice_with_all_values(data)
-                if slice_dict['yz'] is not None:
-                    slice = slice_dict['yz']
-
-        data = data[slice, :, :]
-    elif plane == 'xz':
-        if slice is None:
-            ny = read_parameters_file(paramsfile=paramsfile, paramsvars='ny')
-            slice = (ny // 2) - 1
-            
-            # Check if center slice has all phases
-            unique_values = np.unique(data)
-            if not slice_has_all_phases(data[:, slice, :], unique_values):
-                # Import the function from tools
-                from drp_template.tools import find_slice_with_all_values
-                slice_dict = find_slice_with_all_values(data)
-                if slice_dict['xz'] is not None:
-                    slice = slice_dict['xz']
-
-        data = data[:, slice, :]
-    else:
+        # Membership test on the 2D slice only; no sort of the slice values
+        return np.isin(full_data_unique, data_slice).all()
+
+    spec = _PLANE_SPEC.get(plane)
+    if spec is None:
         raise ValueError("Invalid plane. Use 'xy', 'yz', or 'xz'.")
+    axis = spec['axis']
+
+    if slice is None:
+        n = read_parameters_file(paramsfile=paramsfile, paramsvars=spec['size_key'])
+        slice = (n // 2) - 1
 
-    # Transpose the slice to swap dimensions
+        # Check if center slice has all phases (volume-wide unique values computed once)
+        if unique_values is None:
+            unique_values = _fast_unique(data)
+        if not slice_has_all_phases(data[_plane_index(axis, slice)], unique_values):
+            slice_dict = find_slice_with_all_values(data, unique_values=unique_values)
+            if slice_dict[plane] is not None:
+                slice = slice_dict[plane]
+
+    data = data[_plane_index(axis, slice)]
+
+    # Transpose the slice to swap dimensions (a strided view; the array handed to
+    # imshow is made contiguous once, after any display downsampling)
     data = data.T
 
+    # Raster rendering: a single image (pixel edges at integer coordinates,
+    # like the former pcolormesh) instead of one quad per voxel
+    extent = (0, data.shape[1], 0, data.shape[0])
+    if spec['invert_x']:
+        # Right-to-left x axis set declaratively: mirrored columns drawn over a
+        # reversed extent give the same picture and limits as ax.invert_xaxis()
+        data = data[:, ::-1]
+        extent = (data.shape[1], 0, 0, data.shape[0])
+    imshow_kwargs = dict(
+        interpolation='nearest',
+        origin='lower',
+        aspect='equal',
+        extent=extent,
+    )
+
     # If a normalization is provided (e.g., from ortho_views), use it directly
     if norm is not None:
-        pcm = ax.pcolormesh(data, cmap=cmap_set, norm=norm)
+        display = _downsample_for_display(data, max_display_pixels)
+        pcm = ax.imshow(display, cmap=cmap_set, norm=norm, **imshow_kwargs)
     else:
         # Decide on discrete vs continuous mapping based on the slice content
         pcm = None
@@ -228,138 +338,34 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
             else:
                 t_values = [i / (k - 1) for i in range(k)]
             colors = []
-            sampler = cmap_set if hasattr(cmap_set, '__call__') else plt.cm.get_cmap('viridis')
+            sampler = cmap_set if hasattr(cmap_set, '__call__') else plt.colormaps['viridis']
             for t in t_values:
                 rgba = sampler(t)
                 colors.append(tuple(np.clip(rgba[:3], 0, 1)))
             listed = ListedColormap(colors)
             boundaries = np.concatenate(([unique_vals[0] - 0.5], (unique_vals[:-1] + unique_vals[1:]) / 2.0, [unique_vals[-1] + 0.5]))
             local_norm = BoundaryNorm(boundaries, ncolors=k, clip=True)
-            pcm = ax.pcolormesh(data, cmap=listed, norm=local_norm)
+            display = _downsample_for_display(data, max_display_pixels)
+            pcm = ax.imshow(display, cmap=listed, norm=local_norm, **imshow_kwargs)
         else:
             # Continuous mapping
-            pcm = ax.pcolormesh(data, cmap=cmap_set)
-
-    plt.axis('tight')
-    ax.set_aspect('equal', 'box')
+            display = _downsample_for_display(data, max_display_pixels, block_mean=True)
+            pcm = ax.imshow(display, cmap=cmap_set, **imshow_kwargs)
+            if display.shape != data.shape:
+                # Keep the color limits of the full-resolution slice
+                pcm.set_clim(np.nanmin(data), np.nanmax(data))
 
-    # Set labels and title
-    if plane == 'xy':
-        # Set labels and title with adjusted font size and family
-        ax.set_xlabel('X-axis', color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
-        ax.set_ylabel('Y-axis', color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
-
-        ax.yaxis.tick_right()
-        ax.yaxis.set_label_position("right")
-        ax.spines["right"].set_visible(True)
-
-        # Move the y-axis to the right side
-        ax.invert_xaxis()
-
-        # Set the color of the tick values to white
-        ax.tick_params(axis='both', colors=text_color)
-
-        # Add a colorbar to the left of the plot
-        # Get the position of the subplot area in figure coordinates
-        subplot_position = ax.get_position()
-
-        new_position = [im_left, im_bottom, im_width, im_height]  # left, bottom, width, height
-        ax.set_position(new_position)
-
-        # Get the positions of the subplot area
-        subplot_height = ax.get_position().height
-        subplot_bottom = ax.get_position().y0
-        subplot_left = ax.get_position().x0
-
-        # Set the colorbar position to match the subplot area
-        cax_height = subplot_height
-        cax_bottom = subplot_bottom
-        cax_left = subplot_left - (subplot_left * cax_space_left)
-        cbar = None
-        if show_colorbar:
-            cax = fig.add_axes([cax_left, cax_bottom, cax_width, cax_height])  # left, bottom, width, height
-            cbar = fig.colorbar(pcm, cax=cax, orientation='vertical')
-
-            # Move the colorbar spines to the left
-            cbar.ax.yaxis.set_ticks_position('left')
-            cbar.ax.yaxis.set_label_position('left')
-    elif plane == 'yz':
-        ax.set_xlabel('Y-axis', color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
-        ax.set_ylabel('Z-axis', color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
-
-        ax.yaxis.tick_right()
-        ax.yaxis.set_label_position("right")
-        ax.spines["right"].set_visible(True)
-
-        # Move the y-axis to the right side
-        ax.invert_xaxis()
-        # Set the color of the tick values to white
-        ax.tick_params(axis='both', colors=text_color)
-
-        # Add a colorbar to the left of the plot
-        # Get the position of the subplot area in figure coordinates
-        subplot_position = ax.get_position()
-
-        new_position = [im_left, im_bottom, im_width, im_height]  # left, bottom, width, height
-        ax.set_position(new_position)
-
-        # Get the positions of the subplot area
-        subplot_height = ax.get_position().height
-        subplot_bottom = ax.get_position().y0
-        subplot_left = ax.get_position().x0
-
-        # Set the colorbar position to match the subplot area
-        cax_height = subplot_height
-        cax_bottom = subplot_bottom
-        cax_left = subplot_left - (subplot_left * cax_space_left)
-        cbar = None
-        if show_colorbar:
-            cax = fig.add_axes([cax_left, cax_bottom, cax_width, cax_height])  # left, bottom, width, height
-            cbar = fig.colorbar(pcm, cax=cax, orientation='vertical')
-
-            # Move the colorbar spines to the left
-            cbar.ax.yaxis.set_ticks_position('left')
-            cbar.ax.yaxis.set_label_position('left')
-    elif plane == 'xz':
-        ax.set_xlabel('X-axis', color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
-        ax.set_ylabel('Z-axis', color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
 
-        ax.yaxis.tick_left()
-        ax.yaxis.set_label_position("left")
-        ax.spines["left"].set_visible(True)
-        # Set the color of the tick values to white
-        ax.tick_params(axis='both', colors=text_color)
-
-        # Add a colorbar to the left of the plot
-        # Get the position of the subplot area in figure coordinates
-        subplot_position = ax.get_position()
-
-        new_position = [im_left_xz, im_bottom, im_width, im_height]  # left, bottom, width, height
-        ax.set_position(new_position)
-
-        # Get the positions of the subplot area
-        subplot_height = ax.get_position().height
-        subplot_bottom = ax.get_position().y0
-        subplot_left = ax.get_position().x0
-        subplot_right = subplot_left + ax.get_position().width
-
-        # Set the colorbar position to match the subplot area
-        cax_height = subplot_height
-        cax_bottom = subplot_bottom
-        cax_right = subplot_right + (subplot_right * cax_space_right)
-        cbar = None
-        if show_colorbar:
-            cax = fig.add_axes([cax_right, cax_bottom, cax_width, cax_height])  # left, bottom, width, height
-            cbar = fig.colorbar(pcm, cax=cax, orientation='vertical')
-
-            # Move the colorbar spines to the right
-            cbar.ax.yaxis.set_ticks_position('right')
-            cbar.ax.yaxis.set_label_position('right')
+    # Set labels, tick sides, axes position and colorbar placement for this plane
+    _style_plane_axes(ax, spec, label_kw, text_color)
+    if not caller_layout:
+        ax.set_position([spec['im_left'], im_bottom, im_width, im_height])  # left, bottom, width, height
+    cbar = _place_colorbar(fig, ax, pcm, spec) if show_colorbar else None
 
     if title is None:
-        title = ax.set_title(im_title, color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
+        title = ax.set_title(im_title, **label_kw)
     else:
-        title = ax.set_title(title, color=text_color, fontsize=plt.rcParams['font.size'], fontfamily=plt.rcParams['font.family'])
+        title = ax.set_title(title, **label_kw)
     title.set_position((0.5, 1.0))  # Set the position in axes coordinates
 
     # Set the text color of the colormap
@@ -369,46 +375,24 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
         cbar.ax.tick_params(axis='y', colors=text_color)
 
     if voxel_size is not None:
-        # Get the current tick locations
+        # Five evenly spaced ticks over the current tick range, labelled in physical units
+        # (integer voxel sizes give integer labels, floats one decimal)
         xticks = ax.get_xticks()
         yticks = ax.get_yticks()
+        new_xticks = np.linspace(xticks[0], xticks[-1], 5)
+        new_yticks = np.linspace(yticks[0], yticks[-1], 5)
+        tick_format = '%d' if isinstance(voxel_size, int) else '%.1f'
+        xticklabels = np.char.mod(tick_format, new_xticks * voxel_size).tolist()
+        yticklabels = np.char.mod(tick_format, new_yticks * voxel_size).tolist()
 
-        # Calculate the new tick labels based on the resolution and desired number of ticks
-        if isinstance(voxel_size, int):
-            # resolution is an integer
-            xticklabels = [f'{int(tick * voxel_size)}' for tick in np.linspace(xticks[0], xticks[-1], 5)]
-            yticklabels = [f'{int(tick * voxel_size)}' for tick in np.linspace(yticks[0], yticks[-1], 5)]
-            # Get the current X-axis and Y-axis labels
-            xlabel = ax.get_xlabel()
-            ylabel = ax.get_ylabel()
-
-            # Append the suffix "(µm)" to the labels
-            xlabel += ' (µm)'
-            ylabel += ' (µm)'
-
-            # Set the new X-axis and Y-axis labels
-            ax.set_xlabel(xlabel)
-            ax.set_ylabel(ylabel)
-        else:
-            # resolution is a float
-            xticklabels = [f'{tick * voxel_size:.1f}' for tick in np.linspace(xticks[0], xticks[-1], 5)]
-            yticklabels = [f'{tick * voxel_size:.1f}' for tick in np.linspace(yticks[0], yticks[-1], 5)]
-            # Get the current X-axis and Y-axis labels
-            xlabel = ax.get_xlabel()
-            ylabel = ax.get_ylabel()
-
-            # Append the suffix "(µm)" to the labels
-            xlabel += ' (µm)'
-            ylabel += ' (µm)'
-
-            # Set the new X-axis and Y-axis labels
-            ax.set_xlabel(xlabel)
-            ax.set_ylabel(ylabel)
+        # Append the suffix "(µm)" to the X-axis and Y-axis labels
+        ax.set_xlabel(ax.get_xlabel() + ' (µm)')
+        ax.set_ylabel(ax.get_ylabel() + ' (µm)')
 
         # Set the new tick locations and labels
-        ax.xaxis.set_major_locator(FixedLocator(np.linspace(xticks[0], xticks[-1], 5)))
+        ax.xaxis.set_major_locator(FixedLocator(new_xticks))
         ax.xaxis.set_major_formatter(FixedFormatter(xticklabels))
-        ax.yaxis.set_major_locator(FixedLocator(np.linspace(yticks[0], yticks[-1], 5)))
+        ax.yaxis.set_major_locator(FixedLocator(new_yticks))
         ax.yaxis.set_major_formatter(FixedFormatter(yticklabels))
     else:
         # Set the x-axis and y-axis labels
@@ -427,31 +411,7 @@ def ortho_slice(data, paramsfile='parameters.json', cmap_set=None, slice=None, p
     # UPDATE: 25.04.2025
     # Issue with labels which are not a dictionary
     if labels is not None and cbar is not None:
-        # Convert the dictionary to sortable items
-        if isinstance(labels, dict):
-            # Convert string keys to integers for proper ordering
-            label_items = []
-            for k, v in labels.items():
-                try:
-                    # Try to convert key to integer for sorting
-                    label_items.append((int(k), v))
-                except ValueError:
-                    # If key can't be converted to int, use it as is
-                    label_items.append((k, v))
-            
-            # Sort by key
-            label_items.sort()
-            
-            # Set the ticks and labels
-            tick_positions = [k for k, v in label_items]
-            tick_labels = [v for k, v in label_items]
-            
-            cbar.set_ticks(tick_positions)
-            cbar.ax.set_yticklabels(tick_labels)
-        else:
-            # Handle case where labels is a list
-            cbar.set_ticks(np.arange(len(labels)))
-            cbar.ax.set_yticklabels(labels)
+        _set_colorbar_labels(cbar, labels)
 
     # Add subvolume rectangle if given
     if subvolume is not None:
@@ -522,6 +482,11 @@ def ortho_views(data,
     add_slice_ref : bool, optional (default=True)
         If True, add reference lines showing slice positions across different views.
     
+    Notes:
+    ------
+    For scripted/batch export, set the environment variable ``DRP_AGG=1`` before
+    importing ``drp_template.image`` to use the non-interactive Agg backend.
+    
     Returns:
     --------
     fig : Matplotlib Figure
@@ -550,9 +515,11 @@ def ortho_views(data,
     import matplotlib.pyplot as plt
 
     nz, ny, nx = data.shape
-    # Determine if data are integer-labeled (phases) for discrete mapping
-    is_integer = np.all(np.equal(data, np.round(data)))
-    unique_vals_all = np.unique(data.astype(int)) if is_integer else None
+    # Determine if data are integer-labeled (phases) for discrete mapping; the
+    # analysis is done once here and shared with the color resources and all views
+    analysis = analyze_phase_data(data)
+    is_integer = analysis['is_integer']
+    unique_vals_all = analysis['unique_ids'] if is_integer else None
     shared_norm = None
     shared_cmap = None
     # Use a shared normalization across all views so identical values map to identical colors
@@ -572,7 +539,7 @@ def ortho_views(data,
             base_name = base_name.split('.', 1)[1] if base_name.startswith('cm.') else base_name
         else:
             base_name = 'batlow'
-        color_res = get_phase_color_resources(data, cmap_name=base_name, brightness=float(cmap_intensity) if cmap_intensity else 1.0)
+        color_res = get_phase_color_resources(data, cmap_name=base_name, brightness=float(cmap_intensity) if cmap_intensity else 1.0, analysis=analysis)
         shared_cmap = color_res.get('cmap', None)
         shared_norm = color_res.get('norm', None)
     
@@ -641,6 +608,9 @@ def ortho_views(data,
     slices = [slice_xy, slice_yz, slice_xz]
     titles = ['XY', 'YZ', 'XZ']
 
+    # View title properties, shared by all three subplots
+    title_kw = dict(fontsize=plt.rcParams['font.size'], color='white' if dark_mode else 'black', pad=title_pad)
+
     pcms = []
     for i, (plane, slc, dir_title) in enumerate(zip(planes, slices, titles)):
         _, _, pcm = ortho_slice(
@@ -656,17 +626,16 @@ def ortho_views(data,
             dark_mode=dark_mode,
             cmap_intensity=cmap_intensity,
             ax=axes[i],
-            show_colorbar=False
-            ,
-            norm=shared_norm
+            show_colorbar=False,
+            norm=shared_norm,
+            unique_values=unique_vals_all
         )
         # Align color limits across all subplots for continuous mapping only
         if shared_norm is None and vmin is not None and vmax is not None:
             pcm.set_clim(vmin=vmin, vmax=vmax)
         pcms.append(pcm)
         axes[i].set_aspect('equal')
-        axes[i].set_title(dir_title, fontsize=plt.rcParams['font.size'], 
-                         color='white' if dark_mode else 'black', pad=title_pad)
+        axes[i].set_title(dir_title, **title_kw)
         
         # Don't allow dev_ortho_slice to reposition our axes
         axes[i].set_position(positions[i])
@@ -684,31 +653,7 @@ def ortho_views(data,
     
     # Apply labels to colorbar if provided
     if labels is not None:
-        # Convert the dictionary to sortable items
-        if isinstance(labels, dict):
-            # Convert string keys to integers for proper ordering
-            label_items = []
-            for k, v in labels.items():
-                try:
-                    # Try to convert key to integer for sorting
-                    label_items.append((int(k), v))
-                except ValueError:
-                    # If key can't be converted to int, use it as is
-                    label_items.append((k, v))
-            
-            # Sort by key
-            label_items.sort()
-            
-            # Set the ticks and labels
-            tick_positions = [k for k, v in label_items]
-            tick_labels = [v for k, v in label_items]
-            
-            cbar.set_ticks(tick_positions)
-            cbar.ax.set_yticklabels(tick_labels)
-        else:
-            # Handle case where labels is a list
-            cbar.set_ticks(np.arange(len(labels)))
-            cbar.ax.set_yticklabels(labels)
+        _set_colorbar_labels(cbar, labels)
     
     # Add reference lines to show slice positions across views
     if add_slice_ref is True:
@@ -736,49 +681,31 @@ def add_slice_reference_lines(axes, data_shape, slice_indices, dark_mode=False,
     nz, ny, nx = data_shape
     slice_xy, slice_yz, slice_xz = slice_indices
     
-    # Define line colors and styles
-    line_color = 'red' if dark_mode else 'red'
-    text_color = 'white' if dark_mode else 'black'
-    line_style = '--'
-    line_width = 1.5
-    alpha = 0.8
-    
-    # XY view (axes[0]) - Show yz and xz slice positions
-    # Vertical line for yz slice (x position)
-    axes[0].axvline(x=slice_yz, color=line_color, linestyle=line_style, linewidth=line_width, alpha=alpha)
-    if show_text:
-        axes[0].text(slice_yz, ny*0.05, f"YZ (x={slice_yz})", color=text_color, 
-                 rotation=90, va='bottom', ha='right', backgroundcolor='black' if dark_mode else 'white', alpha=0.7)
-    
-    axes[0].axhline(y=slice_xz, color=line_color, linestyle=line_style, linewidth=line_width, alpha=alpha)
-    if show_text:
-        axes[0].text(nx*0.05, slice_xz, f"XZ (y={slice_xz})", color=text_color, 
-                 rotation=0, va='bottom', ha='right', backgroundcolor='black' if dark_mode else 'white', alpha=0.7)
-    
-    # YZ view (axes[1]) - Show xy and xz slice positions  
-    # Horizontal line for xy slice (z position)
-    axes[1].axhline(y=slice_xy, color=line_color, linestyle=line_style, linewidth=line_width, alpha=alpha)
-    if show_text:
-        axes[1].text(nx*0.05, slice_xy, f"XY (z={slice_xy})", color=text_color, 
-                 rotation=0, va='bottom', ha='right', backgroundcolor='black' if dark_mode else 'white', alpha=0.7)
-    
-    # Vertical line for xz slice (y position)
-    axes[1].axvline(x=slice_xz, color=line_color, linestyle=line_style, linewidth=line_width, alpha=alpha)
-    if show_text:
-        axes[1].text(slice_xz, ny*0.05, f"XZ (y={slice_xz})", color=text_color, 
-                 rotation=90, va='bottom', ha='right', backgroundcolor='black' if dark_mode else 'white', alpha=0.7)
+    # Shared line and text styles, built once for all reference lines
+    line_kw = dict(color='red', linestyle='--', linewidth=1.5, alpha=0.8)
+    text_kw = dict(color='white' if dark_mode else 'black', va='bottom', ha='right',
+                   backgroundcolor='black' if dark_mode else 'white', alpha=0.7)
+    text_x, text_y = nx * 0.05, ny * 0.05
     
-    # XZ view (axes[2]) - Show xy and yz slice positions
-    # Horizontal line for xy slice (z position)
-    axes[2].axhline(y=slice_xy, color=line_color, linestyle=line_style, linewidth=line_width, alpha=alpha)
-    if show_text:
-        axes[2].text(nx*0.05, slice_xy, f"XY (z={slice_xy})", color=text_color, 
-                 rotation=0, va='bottom', ha='right', backgroundcolor='black' if dark_mode else 'white', alpha=0.7)
+    # (axes index, line orientation, position, label) for each reference line:
+    # XY view shows the yz and xz slices, YZ view the xy and xz slices,
+    # XZ view the xy and yz slices
+    references = (
+        (0, 'v', slice_yz, 'YZ (x={})'),
+        (0, 'h', slice_xz, 'XZ (y={})'),
+        (1, 'h', slice_xy, 'XY (z={})'),
+        (1, 'v', slice_xz, 'XZ (y={})'),
+        (2, 'h', slice_xy, 'XY (z={})'),
+        (2, 'v', slice_yz, 'YZ (x={})'),
+    )
     
-    # Vertical line for yz slice (x position)
-    axes[2].axvline(x=slice_yz, color=line_color, linestyle=line_style, linewidth=line_width, alpha=alpha)
-    if show_text:
-        axes[2].text(slice_yz, ny*0.05, f"YZ (x={slice_yz})", color=text_color, 
-                 rotation=90, va='bottom', ha='right', backgroundcolor='black' if dark_mode else 'white', alpha=0.7)
-
-
+    for index, orientation, position, label in references:
+        ax = axes[index]
+        if orientation == 'v':
+            ax.axvline(x=position, **line_kw)
+            if show_text:
+                ax.text(position, text_y, label.format(position), rotation=90, **text_kw)
+        else:
+            ax.axhline(y=position, **line_kw)
+            if show_text:
+                ax.text(text_x, position, label.format(position), rotation=0, **text_kw)
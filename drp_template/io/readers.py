@@ -259,7 +259,16 @@ def import_tiff_sequence(directory, dtype, dimensions=None, voxel_size=None):
     """
     from drp_template.tools import check_binary
 
-    files = [f for f in os.listdir(directory) if f.lower().endswith(('.tif', '.tiff'))]
+    # Single directory pass collecting names and on-disk sizes column-wise
+    files, file_sizes = [], []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(('.tif', '.tiff')):
+                files.append(entry.name)
+                try:
+                    file_sizes.append(entry.stat().st_size)
+                except OSError:
+                    file_sizes.append(None)
     if not files:
         raise FileNotFoundError(f"No TIFF files found in {directory}")
 
@@ -275,10 +284,7 @@ def import_tiff_sequence(directory, dtype, dimensions=None, voxel_size=None):
 
     first_tiff_path = os.path.join(directory, files_sorted[0])
     # Compute total on-disk size for all TIFF slices
-    try:
-        total_size_bytes = sum(os.path.getsize(os.path.join(directory, f)) for f in files_sorted)
-    except Exception:
-        total_size_bytes = None
+    total_size_bytes = None if None in file_sizes else sum(file_sizes)
     # Derive params filename from first TIFF and resolve uniqueness
     # Requirement: drop trailing index in stem (e.g., 'slice_0000.tif' -> 'slice.json')
     first_stem = os.path.splitext(os.path.basename(first_tiff_path))[0]
@@ -12,24 +12,69 @@ __all__ = [
     'get_model_properties'
 ]
 
+# Constant section banners of the get_model_properties report
+_RULE = '=' * 60
+_SUB_RULE = '-' * 60
+_DATA_ANALYSIS_HEADER = f"\n{_SUB_RULE}\nDATA ANALYSIS\n{_SUB_RULE}"
+_PHASE_TABLE_HEADER = (
+    f"\n{_SUB_RULE}\nPHASE DISTRIBUTION (Quick Overview)\n{_SUB_RULE}\n"
+    f"{'Phase':<8} {'Count':>12} {'Percentage':>12}\n{_SUB_RULE}"
+)
+_PHASE_TABLE_FOOTER = (
+    f"{_SUB_RULE}\n"
+    "TIP: For detailed phase analysis with DataFrame output,\n"
+    "   saving to parameters file, and formatted tables, use:\n"
+    "   drp_template.compute.phase_fractions(data, labels=labels)"
+)
+_VALUE_TABLE_HEADER = (
+    f"\n{_SUB_RULE}\nVALUE DISTRIBUTION (showing first 10)\n{_SUB_RULE}\n"
+    f"{'Value':<8} {'Count':>12} {'Percentage':>12}\n{_SUB_RULE}"
+)
+
 
 def list_dir_info(directory, extension=None, search_subdirs=False, return_count=False):
-    """List files or subdirectories in a directory with flexible filtering."""
-    if extension is None:
-        directory_listing = [entry.name for entry in os.scandir(directory) if entry.is_dir()]
-    elif search_subdirs:
-        directory_listing = []
-        for entry in os.scandir(directory):
-            if entry.is_dir():
-                subdir_path = os.path.join(directory, entry.name)
-                has_extension = any(
-                    f.endswith(extension) for f in os.listdir(subdir_path)
-                    if os.path.isfile(os.path.join(subdir_path, f))
-                )
-                if has_extension:
-                    directory_listing.append(entry.name)
-    else:
-        directory_listing = [entry.name for entry in os.scandir(directory) if entry.is_file() and entry.name.endswith(extension)]
+    """
+    List files or subdirectories in a directory with flexible filtering.
+
+    Parameters:
+    -----------
+    directory : str
+        Directory to scan.
+    extension : str or tuple of str, optional (default=None)
+        File extension(s) to match, e.g. '.raw' or ('.tif', '.tiff'). If None,
+        subdirectory names are listed instead of files.
+    search_subdirs : bool, optional (default=False)
+        List subdirectories that contain at least one file matching `extension`.
+    return_count : bool, optional (default=False)
+        Also return the number of listed entries.
+
+    Returns:
+    --------
+    list or (list, int) : Sorted names, plus their count if `return_count` is True.
+    """
+    if isinstance(extension, list):
+        # str.endswith accepts a tuple and matches all extensions in one call
+        extension = tuple(extension)
+
+    with os.scandir(directory) as entries:
+        if extension is None:
+            directory_listing = [entry.name for entry in entries if entry.is_dir()]
+        elif search_subdirs:
+            directory_listing = []
+            for entry in entries:
+                if entry.is_dir():
+                    # DirEntry caches the file type, so no extra stat per file
+                    with os.scandir(entry.path) as sub_entries:
+                        has_extension = any(
+                            f.is_file() and f.name.endswith(extension) for f in sub_entries
+                        )
+                    if has_extension:
+                        directory_listing.append(entry.name)
+        else:
+            directory_listing = [
+                entry.name for entry in entries
+                if entry.name.endswith(extension) and entry.is_file()
+            ]
     sorted_listing = sorted(directory_listing)
     return (sorted_listing, len(sorted_listing)) if return_count else sorted_listing
 
@@ -109,33 +154,25 @@ def get_model_properties(filepath, dimensions=None, labels=None, verbose=True):
 
     if verbose:
         filename = os.path.basename(filepath)
-        print(f"\n{'='*60}")
-        print(f"MODEL PROPERTIES: {filename}")
-        print(f"{'='*60}")
+        print(f"\n{_RULE}\nMODEL PROPERTIES: {filename}\n{_RULE}")
         print(f"File size:        {file_size_mb:.2f} MB")
         print(f"Dimensions:       [{dimensions['nz']}, {dimensions['ny']}, {dimensions['nx']}]")
         if dimensions_inferred:
-            print(f"                  (⚠ inferred - please verify!)")
+            print("                  (⚠ inferred - please verify!)")
         print(f"Total voxels:     {total_voxels:,}")
         try:
             dtype_name = dtype.__name__
         except AttributeError:
             dtype_name = str(dtype)
         print(f"Data type:        {dtype_name}")
-        print(f"\n{'-'*60}")
-        print(f"DATA ANALYSIS")
-        print(f"{'-'*60}")
+        print(_DATA_ANALYSIS_HEADER)
         print(f"Classification:   {data_type}")
         print(f"Unique values:    {stats['num_unique']}")
         print(f"Value range:      [{stats['min_value']}, {stats['max_value']}]")
 
         if data_type == 'segmented':
             print(f"Number of phases: {phase_count}")
-            print(f"\n{'-'*60}")
-            print(f"PHASE DISTRIBUTION (Quick Overview)")
-            print(f"{'-'*60}")
-            print(f"{'Phase':<8} {'Count':>12} {'Percentage':>12}")
-            print(f"{'-'*60}")
+            print(_PHASE_TABLE_HEADER)
             for val in stats['unique_values']:
                 count = stats['value_counts'][int(val)]
                 percentage = stats['value_percentages'][int(val)]
@@ -145,16 +182,9 @@ def get_model_properties(filepath, dimensions=None, labels=None, verbose=True):
                 else:
                     label_str = ""
                 print(f"{int(val):<8} {count:>12,} {percentage:>11.2f}%{label_str}")
-            print(f"{'-'*60}")
-            print(f"TIP: For detailed phase analysis with DataFrame output,")
-            print(f"   saving to parameters file, and formatted tables, use:")
-            print(f"   drp_template.compute.phase_fractions(data, labels=labels)")
+            print(_PHASE_TABLE_FOOTER)
         else:
-            print(f"\n{'-'*60}")
-            print(f"VALUE DISTRIBUTION (showing first 10)")
-            print(f"{'-'*60}")
-            print(f"{'Value':<8} {'Count':>12} {'Percentage':>12}")
-            print(f"{'-'*60}")
+            print(_VALUE_TABLE_HEADER)
             uv = stats['unique_values']
             for i, val in enumerate(uv[: min(10, len(uv))]):
                 count = stats['value_counts'][int(val)]
@@ -163,6 +193,6 @@ def get_model_properties(filepath, dimensions=None, labels=None, verbose=True):
             if stats['num_unique'] > 10:
                 print(f"... and {stats['num_unique'] - 10} more values")
 
-        print(f"{'='*60}\n")
+        print(f"{_RULE}\n")
 
     return results
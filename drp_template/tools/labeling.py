@@ -2,6 +2,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 from drp_template.default_params import update_parameters_file
 
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional dependency
+    njit = None
+
 __all__ = [
     'find_slice_with_all_values',
     'label_binary',
@@ -9,13 +14,67 @@ __all__ = [
 ]
 
 
-def find_slice_with_all_values(data):
-    """Find xy/yz/xz slice indices that contain all unique values present in the 3D array."""
-    unique_values = np.unique(data)
+if njit is not None:
+    @njit(cache=True)
+    def _first_slice_with_all(volume, lut, n_labels):
+        """Index of the first volume[s] containing all labels, or -1.
+
+        ``lut`` maps a voxel value to its label index (-1 for values to ignore).
+        Each slice is left as soon as all labels have been seen.
+        """
+        seen = np.zeros(n_labels, dtype=np.bool_)
+        for s in range(volume.shape[0]):
+            seen[:] = False
+            count = 0
+            for i in range(volume.shape[1]):
+                for j in range(volume.shape[2]):
+                    label = lut[volume[s, i, j]]
+                    if label >= 0 and not seen[label]:
+                        seen[label] = True
+                        count += 1
+                        if count == n_labels:
+                            return s
+        return -1
+else:
+    _first_slice_with_all = None
+
+
+def _find_slices_compiled(data, unique_values):
+    """Compiled slice search for non-negative integer volumes, or None if not applicable."""
+    if (_first_slice_with_all is None or not np.issubdtype(data.dtype, np.integer)
+            or unique_values.size == 0 or unique_values[0] < 0 or unique_values[-1] >= (1 << 16)):
+        return None
+    if data.dtype not in (np.uint8, np.uint16) and (data.min() < 0 or data.max() >= (1 << 16)):
+        return None
+
+    lut = np.full(max(int(data.max()), int(unique_values[-1])) + 1, -1, dtype=np.int64)
+    lut[unique_values.astype(np.int64)] = np.arange(unique_values.size)
+
+    # Slices along axis 2 (xy), 0 (yz) and 1 (xz) as strided views, no copies
+    result = {}
+    for key, axis in (("xy", 2), ("yz", 0), ("xz", 1)):
+        index = _first_slice_with_all(np.moveaxis(data, axis, 0), lut, unique_values.size)
+        result[key] = int(index) if index >= 0 else None
+    return result
+
+
+def find_slice_with_all_values(data, unique_values=None):
+    """Find xy/yz/xz slice indices that contain all unique values present in the 3D array.
+
+    ``unique_values`` may be passed to reuse a precomputed ``np.unique(data)``.
+    For integer volumes the scan runs in a compiled kernel when the optional
+    ``numba`` package is installed.
+    """
+    if unique_values is None:
+        unique_values = np.unique(data)
+    unique_values = np.asarray(unique_values)
+
+    result = _find_slices_compiled(data, unique_values)
+    if result is not None:
+        return result
 
     def check_slice(arr2d):
-        slice_unique_values = np.unique(arr2d)
-        return np.all(np.isin(unique_values, slice_unique_values))
+        return np.isin(unique_values, arr2d).all()
 
     result = {"xy": None, "yz": None, "xz": None}
     for i in range(data.shape[2]):
@@ -31,6 +31,9 @@ setup(
         'vtk': [
             'vtk>=9.2',
         ],
+        'numba': [
+            'numba>=0.57',
+        ],
     },
     python_requires='>=3.8, <4',
 )
\ No newline at end of file
@@ -0,0 +1,82 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from drp_template.default_params import (
+    check_output_folder,
+    read_parameters_file,
+    update_parameters_file,
+)
+
+
+def test_update_parameters_file_writes_numpy_scalars(tmp_path):
+    """NumPy values (as returned by phase_fractions) are stored as plain JSON numbers."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        update_parameters_file('parameters.json', nx=10)
+        update_parameters_file(
+            'parameters.json',
+            fractions={'0': np.float64(0.25), '1': np.float32(0.75)},
+            count=np.int64(3),
+            shape=np.array([10, 10, 10]),
+        )
+
+        params = read_parameters_file('parameters.json')
+        assert params['nx'] == 10
+        assert params['fractions'] == {'0': 0.25, '1': 0.75}
+        assert params['count'] == 3
+        assert params['shape'] == [10, 10, 10]
+
+        # 4-space indentation is kept for existing user files
+        with open(os.path.join('output', 'parameters.json')) as f:
+            assert '\n    "nx": 10' in f.read()
+    finally:
+        os.chdir(cwd)
+
+
+def test_update_parameters_file_keeps_file_on_serialization_error(tmp_path):
+    """A value that cannot be serialized leaves the existing file untouched."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        update_parameters_file('parameters.json', nx=10)
+        with pytest.raises(TypeError):
+            update_parameters_file('parameters.json', bad=object())
+
+        assert read_parameters_file('parameters.json', paramsvars='nx') == 10
+        assert sorted(os.listdir('output')) == ['README.md', 'parameters.json']
+    finally:
+        os.chdir(cwd)
+
+
+def test_update_parameters_file_round_trips_nan(tmp_path):
+    """Non-finite floats are written and read back, and the file stays updatable."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        update_parameters_file('parameters.json', voxel_size=float('nan'))
+        update_parameters_file('parameters.json', nx=10)
+
+        params = read_parameters_file('parameters.json')
+        assert np.isnan(params['voxel_size'])
+        assert params['nx'] == 10
+    finally:
+        os.chdir(cwd)
+
+
+def test_check_output_folder_recreates_deleted_folder(tmp_path):
+    """A cached output folder that was removed is created again."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        output_folder = check_output_folder()
+        shutil.rmtree(output_folder)
+
+        assert check_output_folder() == output_folder
+        assert os.path.isfile(os.path.join(output_folder, 'README.md'))
+        update_parameters_file('parameters.json', nx=10)
+    finally:
+        os.chdir(cwd)
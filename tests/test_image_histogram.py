@@ -0,0 +1,41 @@
+import warnings
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from drp_template.image import histogram
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64', 'int32'])
+def test_histogram_non_gray_dtypes_use_data_range(dtype):
+    """Types without a fixed gray range are binned from 0 up to the data maximum."""
+    scale = 1000 if dtype == 'int32' else 0.8
+    data = (np.random.default_rng(0).random((20, 20, 20)) * scale).astype(dtype)
+
+    fig, ax = histogram(data, dtype=dtype, num_bins=16, log_scale=None)
+    try:
+        # Bars are one PolyCollection: (n_bins, 4, 2) corner vertices
+        verts = np.array([path.vertices[:4] for path in ax.collections[0].get_paths()])
+        assert len(verts) == 16
+        assert verts[:, 1, 1].sum() == data.size
+        assert verts[0, 0, 0] == 0
+        assert verts[-1, 2, 0] == pytest.approx(float(data.max()))
+    finally:
+        plt.close(fig)
+
+
+def test_histogram_warns_only_for_copied_layouts():
+    """Fortran-ordered volumes are counted without a copy; gapped views warn."""
+    data = np.random.default_rng(0).integers(0, 256, (20, 20, 20)).astype(np.uint8)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        fig, _ = histogram(np.asfortranarray(data), dtype='uint8', num_bins=16)
+        plt.close(fig)
+
+    with pytest.warns(RuntimeWarning, match='non-contiguous'):
+        fig, _ = histogram(data[:, ::2], dtype='uint8', num_bins=16)
+        plt.close(fig)
@@ -0,0 +1,48 @@
+import numpy as np
+
+from drp_template.compute.rockphysics.mixing import (
+    MixingContext,
+    brie_fluid_mixing,
+    wood_fluid_mixing,
+)
+
+
+def test_brie_without_oil_matches_water_only_formula():
+    """With no oil the liquid modulus is the water modulus."""
+    k_w, k_g = 2.2e9, 0.01e9
+    k_brie = brie_fluid_mixing(0.5, 0.0, 0.5, k_w, 0.0, k_g, exponent=3)
+    assert np.isclose(k_brie, (k_w - k_g) * 0.5**3 + k_g)
+
+
+def test_brie_gas_only_returns_gas_modulus():
+    """A fully gas-saturated pore space must not divide by zero."""
+    assert np.isclose(brie_fluid_mixing(0.0, 0.0, 1.0, 2.2e9, 0.0, 0.01e9), 0.01e9)
+
+
+def test_brie_water_oil_gas_liquid_modulus():
+    """Water-oil-gas docstring example uses K_L = 1 / (S_w/K_w + S_o/K_o)."""
+    k_w, k_o, k_g = 2.2e9, 0.8e9, 0.01e9
+    k_liquid = 1.0 / (0.4 / k_w + 0.3 / k_o)
+    k_brie = brie_fluid_mixing(0.4, 0.3, 0.3, k_w, k_o, k_g, exponent=3)
+
+    assert np.isclose(k_liquid, 1.7959e9, rtol=1e-4)
+    assert np.isclose(k_brie, (k_liquid - k_g) * 0.7**3 + k_g)
+    assert np.isclose(k_brie, 0.6225e9, rtol=1e-3)
+
+
+def test_mixing_context_matches_wood_fluid_mixing():
+    """Single and batched MixingContext.wood agree with wood_fluid_mixing."""
+    bulk_moduli = [2.2e9, 0.01e9]
+    densities = [1000.0, 1.2]
+    sw = np.linspace(0.1, 0.9, 5)
+    fractions = np.column_stack([sw, 1 - sw])
+
+    ctx = MixingContext(n_phases=2)
+    batch = ctx.wood(fractions, bulk_moduli, densities)
+
+    for i, row in enumerate(fractions):
+        expected = wood_fluid_mixing(row, bulk_moduli, densities)
+        single = ctx.wood(row, bulk_moduli, densities)
+        for key in ('bulk_modulus_reuss', 'rho_avg', 'Vp'):
+            assert np.isclose(single[key], expected[key])
+            assert np.isclose(batch[key][i], expected[key])
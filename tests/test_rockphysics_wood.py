@@ -0,0 +1,42 @@
+import numpy as np
+
+from drp_template.compute.rockphysics.wood import wood
+
+
+def test_wood_quartz_water_velocity_in_m_per_s():
+    """Quartz-water example from the docstring yields a velocity in m/s."""
+    rho_avg, vp, k_reuss = wood(0.4, ['Quartz', 'Water'], [0.6, 0.4], [36e9, 2.2e9], [2650, 1000])
+
+    assert np.isclose(k_reuss, 1.0 / (0.6 / 36e9 + 0.4 / 2.2e9))
+    assert np.isclose(rho_avg, 1990.0)
+    assert np.isclose(vp, np.sqrt(k_reuss / rho_avg))
+    assert 1000.0 < vp < 2000.0
+
+
+def test_wood_batch_matches_single_calls():
+    """A (n_samples, n_phases) fraction table gives the per-row results."""
+    porosity = np.array([0.1, 0.25, 0.4])
+    fraction = np.column_stack([1 - porosity, porosity])
+    bulk_modulus = [36e9, 2.2e9]
+    density = [2650, 1000]
+
+    rho_avg, vp, k_reuss = wood(porosity, ['Quartz', 'Water'], fraction, bulk_modulus, density)
+
+    assert vp.shape == (3,)
+    for i, row in enumerate(fraction):
+        expected = wood(porosity[i], ['Quartz', 'Water'], row, bulk_modulus, density)
+        assert np.allclose((rho_avg[i], vp[i], k_reuss[i]), expected)
+
+
+def test_wood_zero_modulus_matches_batch():
+    """A zero bulk modulus gives K_Reuss = 0 on the single-mixture and batch paths."""
+    fraction = [0.6, 0.4]
+    bulk_modulus = [36e9, 0.0]
+    density = [2650, 1000]
+
+    with np.errstate(divide='ignore'):
+        single = wood(0.4, ['Quartz', 'Gas'], fraction, bulk_modulus, density)
+        batch = wood(0.4, ['Quartz', 'Gas'], [fraction], bulk_modulus, density)
+
+    assert single == (1990.0, 0.0, 0.0)
+    assert np.allclose(single, [value[0] for value in batch])